@@ -6,10 +6,10 @@ validation, and intelligent action planning.
 """
 
 import os
+import http.client
 import json
 import re
-import urllib.request
-import urllib.error
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -19,6 +19,7 @@ from database import (
     get_task,
     update_task,
     log_change,
+    log_changes,
     create_pending_action,
     get_pending_action,
     execute_pending_action,
@@ -574,6 +575,42 @@ def detect_intent(query: str, context: Dict) -> Dict[str, Any]:
 # LLM INTERFACE
 # ============================================================================
 
+_LLM_HOST = "models.inference.ai.azure.com"
+_LLM_PATH = "/chat/completions"
+
+# Persistent keep-alive connection to the LLM API. Reusing it skips the
+# TCP + TLS handshake on every call, which dominates latency for short
+# completions. Guarded by a lock since http.client connections are not
+# thread-safe.
+_llm_conn: Optional[http.client.HTTPSConnection] = None
+_llm_conn_lock = threading.Lock()
+
+
+def _llm_post(body: bytes, headers: Dict[str, str]) -> tuple:
+    """POST to the LLM endpoint over the shared connection.
+
+    Returns (status, reason, response_bytes). Reconnects once if the
+    pooled connection went stale (server closed the keep-alive socket).
+    """
+    global _llm_conn
+    with _llm_conn_lock:
+        for attempt in (1, 2):
+            if _llm_conn is None:
+                _llm_conn = http.client.HTTPSConnection(_LLM_HOST, timeout=60)
+            try:
+                _llm_conn.request("POST", _LLM_PATH, body=body, headers=headers)
+                response = _llm_conn.getresponse()
+                data = response.read()  # drain so the socket stays reusable
+                return response.status, response.reason, data
+            except (http.client.HTTPException, ConnectionError, OSError):
+                try:
+                    _llm_conn.close()
+                except OSError:
+                    pass
+                _llm_conn = None
+                if attempt == 2:
+                    raise
+
 
 def call_llm(
     system_prompt: str, user_prompt: str, history: Optional[List[Dict]] = None
@@ -584,8 +621,6 @@ def call_llm(
         return {"success": False, "message": "API Key missing in .env"}
 
     try:
-        url = "https://models.inference.ai.azure.com/chat/completions"
-
         # Build messages with history
         messages = [{"role": "system", "content": system_prompt}]
 
@@ -606,26 +641,25 @@ def call_llm(
             "response_format": {"type": "json_object"},
         }
 
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
+        status, reason, body = _llm_post(
+            json.dumps(payload).encode("utf-8"),
+            {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {token}",
             },
         )
 
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode())
-            ai_content = result["choices"][0]["message"]["content"]
-            return {"success": True, "data": json.loads(ai_content)}
+        if status >= 400:
+            error_body = body.decode(errors="replace")
+            return {
+                "success": False,
+                "message": f"API Error: {status} {reason} - {error_body[:200]}",
+            }
+
+        result = json.loads(body.decode())
+        ai_content = result["choices"][0]["message"]["content"]
+        return {"success": True, "data": json.loads(ai_content)}
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
-        return {
-            "success": False,
-            "message": f"API Error: {e.code} {e.reason} - {error_body[:200]}",
-        }
     except json.JSONDecodeError as e:
         return {"success": False, "message": f"Invalid JSON from AI: {str(e)}"}
     except Exception as e:
@@ -1024,29 +1058,34 @@ def apply_changes(changes: List[Dict]) -> Dict:
         task_updates[task_id][field] = value
 
     logs = []
+    changelog_rows = []
     total_applied = 0
 
     for task_id, updates in task_updates.items():
-        task = get_task(task_id)
-        if not task:
+        # Apply ALL fields for this task in one call; the returned old row
+        # replaces the separate get_task lookup per task
+        result = update_task(task_id, updates, return_old=True)
+        if result is None:
             continue
+        _, task = result
 
         # Log each field change
         for field, value in updates.items():
             old_value = task.get(field, "?")
             logs.append(f"{task['task']}: {field} {old_value} -> {value}")
 
-        # Apply ALL fields for this task in one call
-        update_task(task_id, updates)
         total_applied += len(updates)
-
-        log_change(
-            "AI_EDIT",
-            task["task"],
-            task.get("resource", ""),
-            "; ".join(f"{f}: {task.get(f, '?')} -> {v}" for f, v in updates.items()),
+        changelog_rows.append(
+            (
+                "AI_EDIT",
+                task["task"],
+                task.get("resource", ""),
+                "; ".join(f"{f}: {task.get(f, '?')} -> {v}" for f, v in updates.items()),
+            )
         )
 
+    log_changes(changelog_rows)
+
     return {"success": True, "logs": logs, "changes_applied": total_applied}
 
 
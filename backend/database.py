@@ -4,8 +4,15 @@ Database Layer - SQLite
 Replaces CSV with proper database operations.
 """
 
+import calendar
+import csv
+import functools
+import math
 import sqlite3
 import json
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from contextlib import contextmanager
@@ -51,6 +58,9 @@ CREATE TABLE IF NOT EXISTS tasks (
     -- Dates
     start_date TEXT,
     finish_date TEXT,
+    -- Days-since-epoch ordinals so hot readers skip strptime entirely
+    start_ord INTEGER GENERATED ALWAYS AS (CAST(julianday(start_date) - julianday('1970-01-01') AS INTEGER)) VIRTUAL,
+    finish_ord INTEGER GENERATED ALWAYS AS (CAST(julianday(finish_date) - julianday('1970-01-01') AS INTEGER)) VIRTUAL,
     percent_complete INTEGER DEFAULT 0,
     task_type TEXT DEFAULT 'Fixed Work',
     parent_task TEXT,
@@ -94,6 +104,15 @@ CREATE TABLE IF NOT EXISTS pending_actions (
     status TEXT DEFAULT 'pending'  -- 'pending', 'executed', 'cancelled'
 );
 
+CREATE TABLE IF NOT EXISTS pending_action_options (
+    action_id INTEGER NOT NULL REFERENCES pending_actions(id),
+    option_no INTEGER NOT NULL,
+    label TEXT,
+    description TEXT,
+    changes_json TEXT,
+    PRIMARY KEY (action_id, option_no)
+);
+
 CREATE INDEX IF NOT EXISTS idx_tasks_resource ON tasks(resource);
 CREATE INDEX IF NOT EXISTS idx_tasks_parent ON tasks(parent_task);
 CREATE INDEX IF NOT EXISTS idx_pending_status ON pending_actions(status);
@@ -127,37 +146,235 @@ CREATE TABLE IF NOT EXISTS baseline_snapshots (
     data TEXT NOT NULL,  -- JSON blob of all tasks at snapshot time
     created_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
+
+-- Small key/value table for one-off flags (e.g. the CSV-migration sentinel)
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+-- Single-row aggregate cache maintained by triggers so get_summary is an
+-- O(1) lookup instead of a full-table scan on every dashboard refresh
+CREATE TABLE IF NOT EXISTS summary_cache (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_tasks INTEGER NOT NULL DEFAULT 0,
+    total_hours REAL NOT NULL DEFAULT 0,
+    total_baseline REAL NOT NULL DEFAULT 0,
+    total_percent REAL NOT NULL DEFAULT 0,
+    total_completed REAL NOT NULL DEFAULT 0,
+    total_remaining REAL NOT NULL DEFAULT 0,
+    total_earned_value REAL NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_summary_insert AFTER INSERT ON tasks BEGIN
+    UPDATE summary_cache SET
+        total_tasks = total_tasks + 1,
+        total_hours = total_hours + COALESCE(NEW.work_hours, 0),
+        total_baseline = total_baseline + COALESCE(NEW.baseline_hours, 0),
+        total_percent = total_percent + COALESCE(NEW.percent_complete, 0),
+        total_completed = total_completed + COALESCE(NEW.hours_completed, 0),
+        total_remaining = total_remaining + COALESCE(NEW.hours_remaining, 0),
+        total_earned_value = total_earned_value + COALESCE(NEW.earned_value, 0)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_summary_delete AFTER DELETE ON tasks BEGIN
+    UPDATE summary_cache SET
+        total_tasks = total_tasks - 1,
+        total_hours = total_hours - COALESCE(OLD.work_hours, 0),
+        total_baseline = total_baseline - COALESCE(OLD.baseline_hours, 0),
+        total_percent = total_percent - COALESCE(OLD.percent_complete, 0),
+        total_completed = total_completed - COALESCE(OLD.hours_completed, 0),
+        total_remaining = total_remaining - COALESCE(OLD.hours_remaining, 0),
+        total_earned_value = total_earned_value - COALESCE(OLD.earned_value, 0)
+    WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_summary_update AFTER UPDATE ON tasks BEGIN
+    UPDATE summary_cache SET
+        total_hours = total_hours + COALESCE(NEW.work_hours, 0) - COALESCE(OLD.work_hours, 0),
+        total_baseline = total_baseline + COALESCE(NEW.baseline_hours, 0) - COALESCE(OLD.baseline_hours, 0),
+        total_percent = total_percent + COALESCE(NEW.percent_complete, 0) - COALESCE(OLD.percent_complete, 0),
+        total_completed = total_completed + COALESCE(NEW.hours_completed, 0) - COALESCE(OLD.hours_completed, 0),
+        total_remaining = total_remaining + COALESCE(NEW.hours_remaining, 0) - COALESCE(OLD.hours_remaining, 0),
+        total_earned_value = total_earned_value + COALESCE(NEW.earned_value, 0) - COALESCE(OLD.earned_value, 0)
+    WHERE id = 1;
+END;
 """
 
 
-@contextmanager
-def get_db():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(DB_PATH)
+# Under WAL, readers and the writer don't block each other. All writes funnel
+# through one shared connection guarded by a lock; SELECT-only paths borrow a
+# pooled read-only connection so dashboard reads never queue behind writers.
+_WRITER_LOCK = threading.Lock()
+_writer_conn = None
+
+_READER_POOL_SIZE = 4
+_reader_pool = queue.LifoQueue(maxsize=_READER_POOL_SIZE)
+
+
+# Connection-scoped tuning PRAGMAs, applied to every new connection.
+# journal_mode=WAL is persistent and set once in init_db.
+_CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=134217728",
+    "cache_size=-20000",
+)
+
+
+def _connect(readonly: bool = False):
+    if readonly:
+        conn = sqlite3.connect(
+            f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False
+        )
+        # Belt and braces on top of mode=ro: reject any stray write statement
+        conn.execute("PRAGMA query_only=ON")
+    else:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+
+@contextmanager
+def get_db(readonly: bool = False):
+    """Context manager for database connections.
+
+    readonly=True yields a pooled read-only connection; the default write
+    path acquires the single shared writer.
+    """
+    global _writer_conn
+    if readonly:
+        try:
+            conn = _reader_pool.get_nowait()
+        except queue.Empty:
+            conn = _connect(readonly=True)
+        try:
+            yield conn
+        finally:
+            try:
+                _reader_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    else:
+        with _WRITER_LOCK:
+            if _writer_conn is None:
+                _writer_conn = _connect()
+            try:
+                yield _writer_conn
+            except BaseException:
+                # The connection is shared: anything left uncommitted by a
+                # failed write path would ride along with the next
+                # caller's commit. Per-call connections rolled this back
+                # implicitly on close; do it explicitly here.
+                _writer_conn.rollback()
+                raise
+
+
+def warm_connection_pool():
+    """Pre-fill the reader pool and open the writer so the first requests
+    don't pay connect/PRAGMA cost."""
+    global _writer_conn
+    with _WRITER_LOCK:
+        if _writer_conn is None:
+            _writer_conn = _connect()
+    while not _reader_pool.full():
+        try:
+            _reader_pool.put_nowait(_connect(readonly=True))
+        except queue.Full:
+            break
+
+
+def close_connections():
+    """Close the writer and all pooled readers (shutdown path)."""
+    global _writer_conn
+    with _WRITER_LOCK:
+        if _writer_conn is not None:
+            _writer_conn.close()
+            _writer_conn = None
+    while True:
+        try:
+            _reader_pool.get_nowait().close()
+        except queue.Empty:
+            break
 
 
 def init_db():
     """Initialize database with schema."""
     with get_db() as conn:
+        # WAL is a persistent, database-level setting: commits append to the
+        # WAL instead of rewriting a rollback journal, and readers don't
+        # block the writer.
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        # Bound WAL growth: cap the journal at 64MB and checkpoint
+        # automatically every ~1000 pages.
+        conn.execute("PRAGMA journal_size_limit = 67108864")
+        conn.execute("PRAGMA wal_autocheckpoint = 1000")
+
         conn.executescript(SCHEMA)
         conn.commit()
 
         # Run migrations for existing databases
         _migrate_schema(conn)
+
+        # Seed the summary cache from current data if the row is missing;
+        # the triggers keep it consistent from here on
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO summary_cache (id, total_tasks, total_hours, total_baseline,
+                                                 total_percent, total_completed, total_remaining,
+                                                 total_earned_value)
+            SELECT 1, COUNT(*), COALESCE(SUM(work_hours), 0), COALESCE(SUM(baseline_hours), 0),
+                   COALESCE(SUM(percent_complete), 0), COALESCE(SUM(hours_completed), 0),
+                   COALESCE(SUM(hours_remaining), 0), COALESCE(SUM(earned_value), 0)
+            FROM tasks
+        """
+        )
+        conn.commit()
     print(f"Database initialized at {DB_PATH}")
 
 
+def checkpoint_db():
+    """Truncate the WAL file and refresh query-planner statistics."""
+    with get_db() as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("PRAGMA optimize")
+
+
+CHECKPOINT_INTERVAL_SECONDS = 15 * 60
+
+_checkpoint_thread = None
+
+
+def start_checkpoint_thread():
+    """Run checkpoint_db periodically from a daemon thread so long-running
+    servers don't accumulate an unbounded -wal file."""
+    global _checkpoint_thread
+    if _checkpoint_thread is not None and _checkpoint_thread.is_alive():
+        return
+
+    def _loop():
+        while True:
+            time.sleep(CHECKPOINT_INTERVAL_SECONDS)
+            try:
+                checkpoint_db()
+            except sqlite3.Error:
+                pass
+
+    _checkpoint_thread = threading.Thread(target=_loop, daemon=True)
+    _checkpoint_thread.start()
+
+
 def _migrate_schema(conn):
     """Add missing columns to existing tables."""
     cursor = conn.cursor()
 
-    # Get existing columns in tasks table
-    cursor.execute("PRAGMA table_info(tasks)")
+    # Get existing columns in tasks table (table_xinfo also lists generated
+    # columns, which plain table_info hides)
+    cursor.execute("PRAGMA table_xinfo(tasks)")
     existing_columns = {row[1] for row in cursor.fetchall()}
 
     # Columns that might be missing from older schemas
@@ -173,24 +390,39 @@ def _migrate_schema(conn):
         ("review_percent", "REAL DEFAULT 0"),
         ("current_phase", "TEXT DEFAULT 'development'"),
         ("cr_stage", "TEXT DEFAULT 'submitted'"),
+        (
+            "start_ord",
+            "INTEGER GENERATED ALWAYS AS (CAST(julianday(start_date) - julianday('1970-01-01') AS INTEGER)) VIRTUAL",
+        ),
+        (
+            "finish_ord",
+            "INTEGER GENERATED ALWAYS AS (CAST(julianday(finish_date) - julianday('1970-01-01') AS INTEGER)) VIRTUAL",
+        ),
     ]
 
-    for col_name, col_def in migrations:
-        if col_name not in existing_columns:
-            try:
-                cursor.execute(f"ALTER TABLE tasks ADD COLUMN {col_name} {col_def}")
-                print(f"Added column: {col_name}")
-            except Exception as e:
-                # Column might already exist or other issue
-                pass
+    needed = [
+        (col_name, col_def)
+        for col_name, col_def in migrations
+        if col_name not in existing_columns
+    ]
+    if not needed:
+        return
+
+    # One schema-change transaction instead of N separate ALTERs, each of
+    # which bumps the schema cookie and invalidates prepared statements
+    script = "".join(
+        f"ALTER TABLE tasks ADD COLUMN {col_name} {col_def};\n"
+        for col_name, col_def in needed
+    )
+    conn.executescript(script)
+    for col_name, _ in needed:
+        print(f"Added column: {col_name}")
 
     conn.commit()
 
 
 def migrate_from_csv(csv_path: Path):
     """Migrate data from CSV to SQLite with phase breakdown."""
-    import csv
-
     if not csv_path.exists():
         print(f"CSV file not found: {csv_path}")
         return
@@ -198,77 +430,173 @@ def migrate_from_csv(csv_path: Path):
     with get_db() as conn:
         cursor = conn.cursor()
 
-        # Clear existing data
-        cursor.execute("DELETE FROM tasks")
+        # On an initial (empty-table) load, drop the secondary indexes so the
+        # bulk insert builds each B-tree once instead of maintaining them
+        # per-row; on re-migration the upsert below touches few rows, so the
+        # indexes stay in place
+        bulk_load = cursor.execute("SELECT EXISTS(SELECT 1 FROM tasks)").fetchone()[0] == 0
+        if bulk_load:
+            cursor.execute("DROP INDEX IF EXISTS idx_tasks_resource")
+            cursor.execute("DROP INDEX IF EXISTS idx_tasks_parent")
 
         with open(csv_path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader with column indexes resolved once from the
+            # header: no per-row dict allocation or key hashing
+            reader = csv.reader(f)
+            header = next(reader)
+            col = {name: i for i, name in enumerate(header)}
+            i_id = col["ID"]
+            i_task = col["Task"]
+            i_resource = col["Resource"]
+            i_work = col["Work_Hours"]
+            i_baseline = col["Baseline_Hours"]
+            i_start = col["Start_Date"]
+            i_finish = col["Finish_Date"]
+            i_percent = col["Percent_Complete"]
+            i_type = col.get("Type")
+            i_parent = col.get("Parent_Task")
+
+            rows = []
+            resources = set()
             for row in reader:
-                work_hours = float(row["Work_Hours"] or 0)
-                baseline_hours = float(row["Baseline_Hours"] or 0)
+                if row[i_resource]:
+                    resources.add(row[i_resource])
+                work_hours = float(row[i_work] or 0)
+                baseline_hours = float(row[i_baseline] or 0)
 
                 # Calculate phase hours based on default ratios
                 dev_hours = work_hours * DEFAULT_PHASE_RATIOS["development"]
                 test_hours = work_hours * DEFAULT_PHASE_RATIOS["testing"]
                 review_hours = work_hours * DEFAULT_PHASE_RATIOS["review"]
 
-                cursor.execute(
-                    """
-                    INSERT INTO tasks (id, task, resource, work_hours, baseline_hours, 
-                                       dev_hours, test_hours, review_hours,
-                                       start_date, finish_date, percent_complete, task_type, parent_task)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                rows.append(
                     (
-                        int(row["ID"]),
-                        row["Task"],
-                        row["Resource"],
+                        int(row[i_id]),
+                        row[i_task],
+                        row[i_resource],
                         work_hours,
                         baseline_hours,
-                        round(dev_hours, 1),
-                        round(test_hours, 1),
-                        round(review_hours, 1),
-                        row["Start_Date"],
-                        row["Finish_Date"],
-                        int(float(row["Percent_Complete"] or 0)),
-                        row.get("Type", "Fixed Work"),
-                        row.get("Parent_Task", ""),
-                    ),
+                        dev_hours,
+                        test_hours,
+                        review_hours,
+                        row[i_start],
+                        row[i_finish],
+                        int(float(row[i_percent] or 0)),
+                        row[i_type] if i_type is not None else "Fixed Work",
+                        row[i_parent] if i_parent is not None else "",
+                    )
                 )
 
-        # Migrate unique resources
-        cursor.execute(
+        # Single prepared statement + one commit instead of per-row execute.
+        # Upsert on id so re-migration updates rows in place instead of
+        # rewriting the whole table (and both indexes) via DELETE + INSERT
+        cursor.executemany(
             """
-            INSERT OR IGNORE INTO resources (name)
-            SELECT DISTINCT resource FROM tasks WHERE resource IS NOT NULL AND resource != ''
-        """
+            INSERT INTO tasks (id, task, resource, work_hours, baseline_hours,
+                               dev_hours, test_hours, review_hours,
+                               start_date, finish_date, percent_complete, task_type, parent_task)
+            VALUES (?, ?, ?, ?, ?, ROUND(?, 1), ROUND(?, 1), ROUND(?, 1), ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                task = excluded.task,
+                resource = excluded.resource,
+                work_hours = excluded.work_hours,
+                baseline_hours = excluded.baseline_hours,
+                dev_hours = excluded.dev_hours,
+                test_hours = excluded.test_hours,
+                review_hours = excluded.review_hours,
+                start_date = excluded.start_date,
+                finish_date = excluded.finish_date,
+                percent_complete = excluded.percent_complete,
+                task_type = excluded.task_type,
+                parent_task = excluded.parent_task,
+                updated_at = CURRENT_TIMESTAMP
+        """,
+            rows,
         )
 
-        # Create default lead preferences for each resource
+        # Rows no longer present in the CSV are removed so the table still
+        # mirrors the file exactly
+        placeholders = ",".join("?" * len(rows))
         cursor.execute(
-            """
-            INSERT OR IGNORE INTO lead_preferences (resource_name)
-            SELECT DISTINCT resource FROM tasks WHERE resource IS NOT NULL AND resource != ''
-        """
+            f"DELETE FROM tasks WHERE id NOT IN ({placeholders})",
+            [r[0] for r in rows],
         )
 
+        # Seed resources and default lead preferences from the distinct
+        # names already collected in memory, instead of re-scanning tasks
+        resource_rows = [(r,) for r in resources]
+        cursor.executemany(
+            "INSERT OR IGNORE INTO resources (name) VALUES (?)", resource_rows
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO lead_preferences (resource_name) VALUES (?)",
+            resource_rows,
+        )
+
+        # Rebuild the indexes over the loaded data and refresh planner stats
+        if bulk_load:
+            cursor.execute("CREATE INDEX idx_tasks_resource ON tasks(resource)")
+            cursor.execute("CREATE INDEX idx_tasks_parent ON tasks(parent_task)")
+        cursor.execute("ANALYZE tasks")
+
         conn.commit()
         print(f"Migrated tasks from CSV with phase breakdown")
 
+    _invalidate_scurve_cache()
+
 
 # === CRUD Operations ===
 
 
+def get_meta(key: str):
+    """Read a value from the meta key/value table (None if unset)."""
+    with get_db(readonly=True) as conn:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+
+def bump_meta_counter(key: str):
+    """Atomically increment an integer counter in the meta key/value table."""
+    with get_db() as conn:
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1",
+            (key,),
+        )
+        conn.commit()
+
+
+def set_meta(key: str, value: str):
+    """Upsert a value in the meta key/value table."""
+    with get_db() as conn:
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+        conn.commit()
+
+
+def has_tasks() -> bool:
+    """Check whether any tasks exist without materializing rows."""
+    with get_db(readonly=True) as conn:
+        return conn.execute("SELECT EXISTS(SELECT 1 FROM tasks)").fetchone()[0] == 1
+
+
 def get_all_tasks():
     """Get all tasks."""
-    with get_db() as conn:
-        rows = conn.execute("SELECT * FROM tasks ORDER BY id").fetchall()
-        return [dict(row) for row in rows]
+    with get_db(readonly=True) as conn:
+        cursor = conn.execute("SELECT * FROM tasks ORDER BY id")
+        # Fetch plain tuples and zip against column names computed once,
+        # skipping the per-row sqlite3.Row allocation on the hottest getter
+        cursor.row_factory = None
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
 
 def get_task(task_id: int):
     """Get single task by ID."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
         return dict(row) if row else None
 
@@ -285,76 +613,215 @@ def parse_date_flexible(date_str: str):
     return None
 
 
+def _add_business_days(start: datetime, n: int) -> datetime:
+    """Return the n-th weekday strictly after start (n >= 1), in O(1)."""
+    full_weeks, rem = divmod(n, 5)
+    if rem == 0:
+        full_weeks -= 1
+        rem = 5
+
+    weekday = start.weekday()
+    if weekday == 5:  # Saturday: first business day is Monday (+2)
+        days = rem + 1
+    elif weekday == 6:  # Sunday: first business day is Monday (+1)
+        days = rem
+    elif weekday + rem <= 4:  # Stays within the current work week
+        days = rem
+    else:  # Crosses one weekend
+        days = rem + 2
+
+    return start + timedelta(days=full_weeks * 7 + days)
+
+
 def recalculate_finish_date(start_date_str: str, remaining_hours: float) -> str:
     """Calculate new finish date based on remaining hours from today."""
     try:
-        from datetime import timedelta
-
         # Validate start_date is parseable (we don't use it for calc, but need it valid)
         start = parse_date_flexible(start_date_str)
         if not start:
             return start_date_str
 
-        work_days = max(remaining_hours / HOURS_PER_DAY, 0)
+        work_days = math.ceil(max(remaining_hours / HOURS_PER_DAY, 0))
         current = datetime.now()
-        days_added = 0
-        while days_added < work_days:
-            current += timedelta(days=1)
-            if current.weekday() < 5:  # Skip weekends
-                days_added += 1
+        if work_days > 0:
+            current = _add_business_days(current, work_days)
         return current.strftime("%Y-%m-%d")
     except Exception:
         return start_date_str
 
 
-def update_task(task_id: int, updates: dict):
-    """Update task fields with practical calculations."""
-    allowed_fields = {
-        "task",
-        "resource",
-        "work_hours",
-        "baseline_hours",
-        "start_date",
-        "finish_date",
-        "percent_complete",
-        "task_type",
-        "parent_task",
-        "hours_completed",
-        "hours_remaining",
-        "earned_value",
-        # Phase-specific fields
-        "dev_hours",
-        "dev_percent",
-        "test_hours",
-        "test_percent",
-        "review_hours",
-        "review_percent",
-        "current_phase",
-        "cr_stage",
-    }
+# Fields a caller is allowed to set through update_task / pending actions
+TASK_UPDATE_FIELDS = {
+    "task",
+    "resource",
+    "work_hours",
+    "baseline_hours",
+    "start_date",
+    "finish_date",
+    "percent_complete",
+    "task_type",
+    "parent_task",
+    "hours_completed",
+    "hours_remaining",
+    "earned_value",
+    # Phase-specific fields
+    "dev_hours",
+    "dev_percent",
+    "test_hours",
+    "test_percent",
+    "review_hours",
+    "review_percent",
+    "current_phase",
+    "cr_stage",
+}
+
+
+def update_task(task_id: int, updates: dict, return_old: bool = False):
+    """Update task fields with practical calculations.
 
-    filtered = {k: v for k, v in updates.items() if k in allowed_fields}
+    With return_old=True, returns (updated, previous) so callers that log
+    field-level diffs don't need a separate SELECT beforehand.
+    """
+    filtered = {k: v for k, v in updates.items() if k in TASK_UPDATE_FIELDS}
     if not filtered:
         return None
 
-    # Get current task for calculations
-    current_task = get_task(task_id)
-    if not current_task:
+    # Single connection: read current row, compute, then UPDATE ... RETURNING
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT * FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if not row:
+            return None
+        current_task = dict(row)
+
+        updated = _apply_task_update(conn, task_id, current_task, filtered, updates)
+        conn.commit()
+
+    _invalidate_scurve_cache()
+
+    # After updating subtask, recalculate parent task totals
+    if updated.get("parent_task"):
+        update_parent_task_totals(updated["parent_task"])
+
+    if return_old:
+        return updated, current_task
+    return updated
+
+
+def update_task_logged(task_id: int, updates: dict):
+    """update_task plus per-field EDIT changelog rows in one transaction.
+
+    Used by the PATCH endpoint: the row update and its changelog entries
+    share a single commit (one fsync) instead of two.
+    """
+    filtered = {k: v for k, v in updates.items() if k in TASK_UPDATE_FIELDS}
+    if not filtered:
         return None
 
+    with get_db() as conn:
+        row = conn.execute(
+            "SELECT * FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if not row:
+            return None
+        current_task = dict(row)
+
+        updated = _apply_task_update(conn, task_id, current_task, filtered, updates)
+        conn.executemany(
+            """
+            INSERT INTO changelog (action, task_name, resource, details)
+            VALUES (?, ?, ?, ?)
+        """,
+            [
+                (
+                    "EDIT",
+                    current_task["task"],
+                    current_task["resource"],
+                    f"{field}: {current_task.get(field, '?')} → {value}",
+                )
+                for field, value in updates.items()
+            ],
+        )
+        conn.commit()
+
+    _invalidate_scurve_cache()
+
+    if updated.get("parent_task"):
+        update_parent_task_totals(updated["parent_task"])
+
+    return updated
+
+
+def bulk_update_tasks(updates_by_id: dict):
+    """Apply several task updates plus their changelog rows in one transaction.
+
+    N single-task PATCHes cost N commits (N fsyncs); a bulk edit from the
+    Gantt view costs one. Unknown task ids are skipped. Returns
+    {task_id: updated_row} for the rows that were updated.
+    """
+    results = {}
+    changelog_rows = []
+    parents = set()
+
+    with get_db() as conn:
+        for task_id, updates in updates_by_id.items():
+            filtered = {k: v for k, v in updates.items() if k in TASK_UPDATE_FIELDS}
+            if not filtered:
+                continue
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            if not row:
+                continue
+            current_task = dict(row)
+
+            updated = _apply_task_update(conn, task_id, current_task, filtered, updates)
+            results[task_id] = updated
+            if updated.get("parent_task"):
+                parents.add(updated["parent_task"])
+            changelog_rows.extend(
+                (
+                    "EDIT",
+                    current_task["task"],
+                    current_task["resource"],
+                    f"{field}: {current_task.get(field, '?')} → {value}",
+                )
+                for field, value in updates.items()
+            )
+        if changelog_rows:
+            conn.executemany(
+                """
+                INSERT INTO changelog (action, task_name, resource, details)
+                VALUES (?, ?, ?, ?)
+            """,
+                changelog_rows,
+            )
+        conn.commit()
+
+    if results:
+        _invalidate_scurve_cache()
+    for parent in parents:
+        update_parent_task_totals(parent)
+
+    return results
+
+
+def _apply_task_update(conn, task_id, current_task, filtered, updates):
+    """Compute derived fields and run the UPDATE, returning the new row."""
     work_hours = filtered.get("work_hours", current_task["work_hours"])
     baseline_hours = filtered.get("baseline_hours", current_task["baseline_hours"])
     percent = filtered.get("percent_complete", current_task["percent_complete"])
 
-    # Calculate derived values
+    # Calculate derived values (rounded in SQL below)
     hours_completed = work_hours * (percent / 100.0)
     hours_remaining = work_hours * (1 - percent / 100.0)
     earned_value = baseline_hours * (percent / 100.0)
 
     # Add calculated fields
-    filtered["hours_completed"] = round(hours_completed, 1)
-    filtered["hours_remaining"] = round(hours_remaining, 1)
-    filtered["earned_value"] = round(earned_value, 1)
+    filtered["hours_completed"] = hours_completed
+    filtered["hours_remaining"] = hours_remaining
+    filtered["earned_value"] = earned_value
 
     # Recalculate finish date if progress or hours changed (but don't overwrite explicit finish_date)
     if (
@@ -370,22 +837,26 @@ def update_task(task_id: int, updates: dict):
             # Task is complete - keep current finish date or set to today
             pass
 
-    set_clause = ", ".join(f"{k} = ?" for k in filtered.keys())
-    values = list(filtered.values()) + [task_id]
+    # Stable, cached statement text per field set: repeated PATCH bodies with
+    # the same fields reuse sqlite3's prepared-statement cache
+    fields = tuple(sorted(filtered))
+    values = [filtered[k] for k in fields] + [task_id]
 
-    with get_db() as conn:
-        conn.execute(
-            f"UPDATE tasks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-            values,
-        )
-        conn.commit()
+    updated = conn.execute(_update_task_sql(fields), values).fetchone()
+    return dict(updated)
 
-    # After updating subtask, recalculate parent task totals
-    updated_task = get_task(task_id)
-    if updated_task and updated_task.get("parent_task"):
-        update_parent_task_totals(updated_task["parent_task"])
 
-    return get_task(task_id)
+@functools.lru_cache(maxsize=128)
+def _update_task_sql(fields: tuple) -> str:
+    """Build the UPDATE statement for a sorted tuple of field names.
+
+    Derived hour fields are rounded in SQL rather than in Python.
+    """
+    rounded_fields = {"hours_completed", "hours_remaining", "earned_value"}
+    set_clause = ", ".join(
+        f"{k} = ROUND(?, 1)" if k in rounded_fields else f"{k} = ?" for k in fields
+    )
+    return f"UPDATE tasks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ? RETURNING *"
 
 
 def update_parent_task_totals(parent_task_name: str):
@@ -434,29 +905,29 @@ def update_parent_task_totals(parent_task_name: str):
 
         # Update the parent task
         conn.execute(
-            """UPDATE tasks SET 
-                work_hours = ?,
-                baseline_hours = ?,
-                hours_completed = ?,
-                hours_remaining = ?,
-                earned_value = ?,
-                dev_hours = ?,
-                test_hours = ?,
-                review_hours = ?,
+            """UPDATE tasks SET
+                work_hours = ROUND(?, 1),
+                baseline_hours = ROUND(?, 1),
+                hours_completed = ROUND(?, 1),
+                hours_remaining = ROUND(?, 1),
+                earned_value = ROUND(?, 1),
+                dev_hours = ROUND(?, 1),
+                test_hours = ROUND(?, 1),
+                review_hours = ROUND(?, 1),
                 percent_complete = ?,
                 start_date = COALESCE(?, start_date),
                 finish_date = COALESCE(?, finish_date),
                 updated_at = CURRENT_TIMESTAMP
             WHERE task = ?""",
             (
-                round(total_work_hours, 1),
-                round(total_baseline_hours, 1),
-                round(total_hours_completed, 1),
-                round(total_hours_remaining, 1),
-                round(total_earned_value, 1),
-                round(total_dev_hours, 1),
-                round(total_test_hours, 1),
-                round(total_review_hours, 1),
+                total_work_hours,
+                total_baseline_hours,
+                total_hours_completed,
+                total_hours_remaining,
+                total_earned_value,
+                total_dev_hours,
+                total_test_hours,
+                total_review_hours,
                 overall_percent,
                 earliest_start,
                 latest_finish,
@@ -465,6 +936,8 @@ def update_parent_task_totals(parent_task_name: str):
         )
         conn.commit()
 
+    _invalidate_scurve_cache()
+
 
 def log_change(action: str, task_name: str, resource: str, details: str):
     """Log a change to the changelog."""
@@ -479,9 +952,24 @@ def log_change(action: str, task_name: str, resource: str, details: str):
         conn.commit()
 
 
+def log_changes(entries):
+    """Insert many (action, task_name, resource, details) changelog rows at once."""
+    if not entries:
+        return
+    with get_db() as conn:
+        conn.executemany(
+            """
+            INSERT INTO changelog (action, task_name, resource, details)
+            VALUES (?, ?, ?, ?)
+        """,
+            entries,
+        )
+        conn.commit()
+
+
 def get_changelog(limit: int = 50):
     """Get recent changelog entries."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         rows = conn.execute(
             "SELECT * FROM changelog ORDER BY timestamp DESC LIMIT ?", (limit,)
         ).fetchall()
@@ -490,7 +978,7 @@ def get_changelog(limit: int = 50):
 
 def get_resources():
     """Get all resources."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         rows = conn.execute("SELECT * FROM resources WHERE is_active = 1").fetchall()
         return [dict(row) for row in rows]
 
@@ -504,8 +992,6 @@ def get_resource_allocation():
     tasks = get_all_tasks()
 
     # Calculate project timeline for capacity estimation
-    from datetime import datetime
-
     all_dates = []
     for t in tasks:
         try:
@@ -563,293 +1049,300 @@ def get_resource_allocation():
 
 
 def get_summary():
-    """Get aggregated summary statistics with earned value."""
-    with get_db() as conn:
+    """Get aggregated summary statistics with earned value.
+
+    Reads the trigger-maintained summary_cache row instead of scanning tasks.
+    """
+    with get_db(readonly=True) as conn:
         row = conn.execute(
             """
-            SELECT 
-                COUNT(*) as total_tasks,
-                SUM(work_hours) as total_hours,
-                SUM(baseline_hours) as total_baseline,
-                SUM(work_hours) - SUM(baseline_hours) as total_variance,
-                AVG(percent_complete) as avg_percent,
-                COALESCE(SUM(hours_completed), 0) as total_completed,
-                COALESCE(SUM(hours_remaining), 0) as total_remaining,
-                COALESCE(SUM(earned_value), 0) as total_earned_value
-            FROM tasks
+            SELECT
+                total_tasks,
+                total_hours,
+                total_baseline,
+                total_hours - total_baseline as total_variance,
+                CASE WHEN total_tasks > 0 THEN total_percent / total_tasks END as avg_percent,
+                total_completed,
+                total_remaining,
+                total_earned_value
+            FROM summary_cache WHERE id = 1
         """
         ).fetchone()
         return dict(row)
 
 
-def get_scurve_data():
-    """
-    Get S-curve data with three lines:
-    - Baseline: Planned cumulative baseline_hours
-    - Scheduled: Current cumulative work_hours
-    - Earned: Cumulative earned value (baseline × percent_complete)
+# Per-process cache of computed S-curves keyed by project name (None = all
+# tasks), each entry tagged with the task write generation it was built at.
+# The generation itself lives in the meta table so that a write performed
+# by one gunicorn worker invalidates the curves every sibling worker has
+# cached — a process-local counter only ever bumps in the writing process.
+# Stale entries are simply ignored, so a write racing a compute can never
+# resurrect an outdated curve.
+_SCURVE_CACHE = {}
+_TASKS_VERSION_KEY = "tasks_version"
 
-    Uses simple date-based accumulation for clarity.
-    """
-    from datetime import datetime, timedelta
 
-    tasks = get_all_tasks()
-    if not tasks:
-        return {"labels": [], "baseline": [], "scheduled": [], "earned": []}
+def _invalidate_scurve_cache():
+    """Bump the shared task write generation after any task mutation."""
+    bump_meta_counter(_TASKS_VERSION_KEY)
 
-    # Get date range from tasks
-    all_dates = []
-    for t in tasks:
-        try:
-            if t.get("start_date"):
-                all_dates.append(datetime.strptime(t["start_date"], "%Y-%m-%d"))
-            if t.get("finish_date"):
-                all_dates.append(datetime.strptime(t["finish_date"], "%Y-%m-%d"))
-        except:
-            pass
 
-    if not all_dates:
-        return {"labels": [], "baseline": [], "scheduled": [], "earned": []}
-
-    min_date = min(all_dates)
-    max_date = max(all_dates)
-    today = datetime.now()
-
-    # Create weekly timeline points
-    timeline = []
-    current = min_date
-    while current <= max_date:
-        timeline.append(current)
-        current += timedelta(days=7)
-
-    # Ensure we have at least the end date
-    if not timeline or timeline[-1] < max_date:
-        timeline.append(max_date)
-
-    # Build cumulative data for each point in timeline
-    labels = []
-    baseline_data = []
-    scheduled_data = []
-    earned_data = []
-
-    for point_date in timeline:
-        labels.append(point_date.strftime("%b %d"))
+def tasks_version() -> int:
+    """Current task write generation, for callers keying caches on it.
 
-        baseline_cum = 0
-        scheduled_cum = 0
-        earned_cum = 0
-
-        for t in tasks:
-            try:
-                start = datetime.strptime(t["start_date"], "%Y-%m-%d")
-                finish = datetime.strptime(t["finish_date"], "%Y-%m-%d")
-
-                baseline_hours = float(t.get("baseline_hours", 0) or 0)
-                work_hours = float(t.get("work_hours", 0) or 0)
-                percent = float(t.get("percent_complete", 0) or 0) / 100.0
-                earned_value = baseline_hours * percent
-
-                if point_date < start:
-                    # Task hasn't started - add nothing
-                    continue
-                elif point_date >= finish:
-                    # Task should be complete - add full planned hours
-                    baseline_cum += baseline_hours
-                    scheduled_cum += work_hours
-                    # Earned value only if this date is in the past
-                    if point_date <= today:
-                        earned_cum += earned_value
-                else:
-                    # Task in progress - add proportional amount
-                    duration = (finish - start).days or 1
-                    elapsed = (point_date - start).days
-                    portion = elapsed / duration
-
-                    baseline_cum += baseline_hours * portion
-                    scheduled_cum += work_hours * portion
-                    # Earned value proportional to actual completion
-                    if point_date <= today:
-                        earned_cum += earned_value * portion
-
-            except Exception:
-                continue
-
-        baseline_data.append(round(baseline_cum, 1))
-        scheduled_data.append(round(scheduled_cum, 1))
-        earned_data.append(round(earned_cum, 1))
-
-    return {
-        "labels": labels,
-        "baseline": baseline_data,
-        "scheduled": scheduled_data,
-        "earned": earned_data,
-    }
+    Shared across worker processes via the meta table; the read is a
+    point query on a pooled read-only connection.
+    """
+    return int(get_meta(_TASKS_VERSION_KEY) or 0)
+
+
+def _cached_scurve(key):
+    """Return the cached curve for key, computing it if missing or stale."""
+    version, result = _SCURVE_CACHE.get(key, (-1, None))
+    current = tasks_version()
+    if version == current:
+        return result
+    # Tag the entry with the generation read *before* loading inputs: a
+    # write committing mid-compute bumps the counter, so the curve built
+    # from pre-write rows stays marked stale and the next read recomputes
+    result = _compute_scurve(_load_scurve_inputs(key))
+    if key is not None:
+        result["project"] = key
+    _SCURVE_CACHE[key] = (current, result)
+    return result
 
 
-def get_project_scurve_data(parent_task_name: str):
-    """Get S-curve data for a specific project - same logic as main S-curve but filtered."""
-    from datetime import datetime, timedelta
+_EPOCH = datetime(1970, 1, 1)
 
-    tasks = get_all_tasks()
 
-    # Filter to only this project's tasks
-    project_tasks = [
-        t
-        for t in tasks
-        if t["task"] == parent_task_name or t["parent_task"] == parent_task_name
-    ]
+def _load_scurve_inputs(parent_task_name: str = None):
+    """Fetch the four S-curve columns, optionally filtered to one project.
 
-    if not project_tasks:
-        return {
-            "labels": [],
-            "baseline": [],
-            "scheduled": [],
-            "earned": [],
-            "project": parent_task_name,
-        }
+    The filter runs in SQL (using idx_tasks_parent) and dates come from the
+    start_ord/finish_ord generated columns, so no strptime is needed and
+    only the needed columns cross the SQLite boundary.
+    """
+    sql = """SELECT start_ord, finish_ord, baseline_hours, work_hours, percent_complete
+             FROM tasks
+             WHERE start_ord IS NOT NULL AND finish_ord IS NOT NULL"""
+    params = ()
+    if parent_task_name is not None:
+        sql += " AND (task = ? OR parent_task = ?)"
+        params = (parent_task_name, parent_task_name)
+
+    with get_db(readonly=True) as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    parsed = []
+    for t in rows:
+        baseline_hours = float(t["baseline_hours"] or 0)
+        percent = float(t["percent_complete"] or 0) / 100.0
+        parsed.append(
+            {
+                "start": _EPOCH + timedelta(days=t["start_ord"]),
+                "finish": _EPOCH + timedelta(days=t["finish_ord"]),
+                "baseline_hours": baseline_hours,
+                "work_hours": float(t["work_hours"] or 0),
+                "earned_value": baseline_hours * percent,
+            }
+        )
+    return parsed
 
-    # Get date range
-    all_dates = []
-    for t in project_tasks:
-        try:
-            if t.get("start_date"):
-                all_dates.append(datetime.strptime(t["start_date"], "%Y-%m-%d"))
-            if t.get("finish_date"):
-                all_dates.append(datetime.strptime(t["finish_date"], "%Y-%m-%d"))
-        except:
-            pass
 
-    if not all_dates:
-        return {
-            "labels": [],
-            "baseline": [],
-            "scheduled": [],
-            "earned": [],
-            "project": parent_task_name,
-        }
+def _compute_scurve(tasks):
+    """Build cumulative baseline/scheduled/earned series from parsed tasks."""
+    if not tasks:
+        return {"labels": [], "baseline": [], "scheduled": [], "earned": []}
 
-    min_date = min(all_dates)
-    max_date = max(all_dates)
+    min_date = min(t["start"] for t in tasks)
+    max_date = max(
+        max(t["start"] for t in tasks), max(t["finish"] for t in tasks)
+    )
     today = datetime.now()
 
-    # Weekly timeline
-    timeline = []
-    current = min_date
-    while current <= max_date:
-        timeline.append(current)
-        current += timedelta(days=7)
-    if not timeline or timeline[-1] < max_date:
+    # Weekly timeline points, generated in one shot from the span length
+    # instead of a compare-and-increment loop
+    n_weeks = (max_date - min_date).days // 7 + 1
+    timeline = [min_date + timedelta(days=7 * i) for i in range(n_weeks)]
+    if timeline[-1] < max_date:
         timeline.append(max_date)
 
-    # Build cumulative data
     labels = []
     baseline_data = []
     scheduled_data = []
     earned_data = []
 
-    for point_date in timeline:
-        labels.append(point_date.strftime("%b %d"))
-
-        baseline_cum = 0
-        scheduled_cum = 0
-        earned_cum = 0
+    # Each task contributes linearly between start and finish, so instead of
+    # an O(points × tasks) nested loop, spread each task's daily rate into a
+    # difference array once, prefix-sum it, and sample the weekly points.
+    n_days = (max_date - min_date).days + 1
+    rates = [[0.0] * (n_days + 1) for _ in range(3)]  # baseline, scheduled, earned
+    jumps = [[0.0] * n_days for _ in range(3)]  # zero-duration tasks
 
-        for t in project_tasks:
-            try:
-                start = datetime.strptime(t["start_date"], "%Y-%m-%d")
-                finish = datetime.strptime(t["finish_date"], "%Y-%m-%d")
-
-                baseline_hours = float(t.get("baseline_hours", 0) or 0)
-                work_hours = float(t.get("work_hours", 0) or 0)
-                percent = float(t.get("percent_complete", 0) or 0) / 100.0
-                earned_value = baseline_hours * percent
-
-                if point_date < start:
-                    continue
-                elif point_date >= finish:
-                    baseline_cum += baseline_hours
-                    scheduled_cum += work_hours
-                    if point_date <= today:
-                        earned_cum += earned_value
-                else:
-                    duration = (finish - start).days or 1
-                    elapsed = (point_date - start).days
-                    portion = elapsed / duration
-
-                    baseline_cum += baseline_hours * portion
-                    scheduled_cum += work_hours * portion
-                    if point_date <= today:
-                        earned_cum += earned_value * portion
-
-            except Exception:
-                continue
+    for t in tasks:
+        s = (t["start"] - min_date).days
+        f = (t["finish"] - min_date).days
+        amounts = (t["baseline_hours"], t["work_hours"], t["earned_value"])
+        if f > s:
+            duration = f - s
+            for arr, amount in zip(rates, amounts):
+                rate = amount / duration
+                arr[s] += rate
+                arr[f] -= rate
+        else:
+            # Finish on/before start: full amount counts from the start day
+            for arr, amount in zip(jumps, amounts):
+                arr[s] += amount
+
+    # Cumulative value at day d = rates accumulated over days < d,
+    # plus jumps accumulated over days <= d
+    cums = []
+    for rate_arr, jump_arr in zip(rates, jumps):
+        cum = [0.0] * n_days
+        daily = 0.0
+        running = jump_arr[0]
+        cum[0] = running
+        for d in range(1, n_days):
+            daily += rate_arr[d - 1]  # daily rate in effect on day d-1
+            running += daily + jump_arr[d]
+            cum[d] = running
+        cums.append(cum)
 
-        baseline_data.append(round(baseline_cum, 1))
-        scheduled_data.append(round(scheduled_cum, 1))
-        earned_data.append(round(earned_cum, 1))
+    for point_date in timeline:
+        labels.append(point_date.strftime("%b %d"))
+        idx = (point_date - min_date).days
+        baseline_data.append(round(cums[0][idx], 1))
+        scheduled_data.append(round(cums[1][idx], 1))
+        # Earned value is only plotted up to today
+        earned_data.append(round(cums[2][idx], 1) if point_date <= today else 0.0)
 
     return {
         "labels": labels,
         "baseline": baseline_data,
         "scheduled": scheduled_data,
         "earned": earned_data,
-        "project": parent_task_name,
     }
 
 
+def get_scurve_data():
+    """
+    Get S-curve data with three lines:
+    - Baseline: Planned cumulative baseline_hours
+    - Scheduled: Current cumulative work_hours
+    - Earned: Cumulative earned value (baseline × percent_complete)
+
+    Served from the process-wide cache; parsing and cumulative math only
+    re-run after a task write.
+    """
+    return _cached_scurve(None)
+
+
+def get_project_scurve_data(parent_task_name: str):
+    """Get S-curve data for a specific project - same cached pipeline as the
+    main S-curve, with the project filter pushed into SQL."""
+    return _cached_scurve(parent_task_name)
+
+
 # === Pending Actions (Multi-turn AI) ===
 
 
 def create_pending_action(
     task_id: int, action_type: str, original_query: str, options: list
 ) -> int:
-    """Create a pending action that needs user confirmation."""
-    import json
-    from datetime import datetime, timedelta
+    """Create a pending action that needs user confirmation.
 
+    Options are stored normalized in pending_action_options (one row per
+    option) so execution can fetch just the chosen row by primary key.
+    """
     expires_at = (datetime.now() + timedelta(minutes=5)).isoformat()
 
     with get_db() as conn:
         cursor = conn.execute(
             """
-            INSERT INTO pending_actions (task_id, action_type, original_query, options, expires_at)
+            INSERT INTO pending_actions (task_id, action_type, original_query, expires_at)
+            VALUES (?, ?, ?, ?)
+        """,
+            (task_id, action_type, original_query, expires_at),
+        )
+        action_id = cursor.lastrowid
+        conn.executemany(
+            """
+            INSERT INTO pending_action_options (action_id, option_no, label, description, changes_json)
             VALUES (?, ?, ?, ?, ?)
         """,
-            (task_id, action_type, original_query, json.dumps(options), expires_at),
+            [
+                (
+                    action_id,
+                    opt.get("option", i + 1),
+                    opt.get("label", ""),
+                    opt.get("description", ""),
+                    json.dumps(opt.get("changes", [])),
+                )
+                for i, opt in enumerate(options)
+            ],
         )
         conn.commit()
-        return cursor.lastrowid
+        return action_id
 
 
 def get_pending_action(action_id: int):
-    """Get a pending action by ID."""
-    import json
-
-    with get_db() as conn:
+    """Get a pending action by ID, with its options reassembled."""
+    with get_db(readonly=True) as conn:
         row = conn.execute(
             "SELECT * FROM pending_actions WHERE id = ? AND status = 'pending'",
             (action_id,),
         ).fetchone()
-        if row:
-            result = dict(row)
-            result["options"] = json.loads(result["options"])
-            return result
-        return None
+        if not row:
+            return None
+
+        result = dict(row)
+        option_rows = conn.execute(
+            """SELECT option_no, label, description, changes_json
+               FROM pending_action_options WHERE action_id = ? ORDER BY option_no""",
+            (action_id,),
+        ).fetchall()
+        result["options"] = [
+            {
+                "option": o["option_no"],
+                "label": o["label"],
+                "description": o["description"],
+                "changes": json.loads(o["changes_json"]),
+            }
+            for o in option_rows
+        ]
+        return result
+
+
+def _get_pending_action_option(action_id: int, option_no: int):
+    """Fetch a single option row by primary key — no parsing of siblings."""
+    with get_db(readonly=True) as conn:
+        row = conn.execute(
+            """SELECT option_no, label, description, changes_json
+               FROM pending_action_options WHERE action_id = ? AND option_no = ?""",
+            (action_id, option_no),
+        ).fetchone()
+        if not row:
+            return None
+        return {
+            "option": row["option_no"],
+            "label": row["label"],
+            "description": row["description"],
+            "changes": json.loads(row["changes_json"]),
+        }
 
 
 def execute_pending_action(action_id: int, chosen_option: int):
     """Execute a pending action with the user's choice (1-based option number)."""
-    action = get_pending_action(action_id)
+    with get_db(readonly=True) as conn:
+        action = conn.execute(
+            "SELECT id FROM pending_actions WHERE id = ? AND status = 'pending'",
+            (action_id,),
+        ).fetchone()
     if not action:
         return {"success": False, "message": "Action not found or expired"}
 
-    # Find option by option number (1, 2, 3, 4, 5 etc.)
-    option = None
-    for opt in action["options"]:
-        if opt.get("option") == chosen_option:
-            option = opt
-            break
-
+    # Fetch only the chosen option — indexed lookup, no scan
+    option = _get_pending_action_option(action_id, chosen_option)
     if not option:
         return {"success": False, "message": f"Invalid option: {chosen_option}"}
 
@@ -872,28 +1365,63 @@ def execute_pending_action(action_id: int, chosen_option: int):
 
     changes = option.get("changes", [])
 
-    # Apply the changes
+    # Apply all changes in one transaction: bulk-fetch the affected rows,
+    # update each on the same connection, batch the changelog inserts, and
+    # commit once instead of once per change.
     logs = []
-    for change in changes:
-        task = get_task(change["id"])
-        if task:
-            old_val = task.get(change["field"], "?")
-            update_task(change["id"], {change["field"]: change["value"]})
-            log_change(
-                "PHASE_ADJUST",
-                task["task"],
-                task["resource"],
-                f"{change['field']}: {old_val} → {change['value']}",
+    parents = set()
+    with get_db() as conn:
+        task_ids = sorted({c["id"] for c in changes})
+        tasks = {}
+        if task_ids:
+            placeholders = ", ".join("?" * len(task_ids))
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE id IN ({placeholders})", task_ids
+            ).fetchall()
+            tasks = {r["id"]: dict(r) for r in rows}
+
+        log_rows = []
+        for change in changes:
+            task = tasks.get(change["id"])
+            field = change["field"]
+            if not task or field not in TASK_UPDATE_FIELDS:
+                continue
+            old_val = task.get(field, "?")
+            updated = _apply_task_update(
+                conn, task["id"], task, {field: change["value"]}, {field: change["value"]}
+            )
+            tasks[task["id"]] = updated
+            if updated.get("parent_task"):
+                parents.add(updated["parent_task"])
+            log_rows.append(
+                (
+                    "PHASE_ADJUST",
+                    task["task"],
+                    task["resource"],
+                    f"{field}: {old_val} → {change['value']}",
+                )
+            )
+            logs.append(f"{task['task']}: {field} → {change['value']}")
+
+        if log_rows:
+            conn.executemany(
+                """
+                INSERT INTO changelog (action, task_name, resource, details)
+                VALUES (?, ?, ?, ?)
+            """,
+                log_rows,
             )
-            logs.append(f"{task['task']}: {change['field']} → {change['value']}")
 
-    # Mark as executed
-    with get_db() as conn:
+        # Mark as executed
         conn.execute(
             "UPDATE pending_actions SET status = 'executed' WHERE id = ?", (action_id,)
         )
         conn.commit()
 
+    _invalidate_scurve_cache()
+    for parent in parents:
+        update_parent_task_totals(parent)
+
     return {"success": True, "logs": logs, "message": option.get("label", "Applied")}
 
 
@@ -908,7 +1436,7 @@ def cancel_pending_action(action_id: int):
 
 def get_lead_preference(resource_name: str):
     """Get lead preferences for a resource."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         row = conn.execute(
             "SELECT * FROM lead_preferences WHERE resource_name = ?", (resource_name,)
         ).fetchone()
@@ -946,10 +1474,6 @@ def adjust_task_phase(
         - 'phase_only': Add hours to just this phase
         - 'scale_all': Scale all phases proportionally
     """
-    task = get_task(task_id)
-    if not task:
-        return None
-
     phase_map = {
         "development": "dev_hours",
         "dev": "dev_hours",
@@ -962,29 +1486,56 @@ def adjust_task_phase(
     if not phase_field:
         return None
 
+    # Single atomic UPDATE with column self-reference — no read-modify-write
+    # race window, and derived hours are recomputed in the same statement.
+    derived_sql = """
+        hours_completed = ROUND((work_hours + ?) * percent_complete / 100.0, 1),
+        hours_remaining = ROUND((work_hours + ?) * (1 - percent_complete / 100.0), 1),
+        updated_at = CURRENT_TIMESTAMP
+    """
+
     if mode == "phase_only":
         # Just add to this phase
-        new_phase_hours = task[phase_field] + hours_delta
-        new_total = task["work_hours"] + hours_delta
-        updates = {
-            phase_field: round(new_phase_hours, 1),
-            "work_hours": round(new_total, 1),
-        }
+        sql = f"""UPDATE tasks SET
+            {phase_field} = ROUND({phase_field} + ?, 1),
+            work_hours = ROUND(work_hours + ?, 1),
+            {derived_sql}
+            WHERE id = ?
+            RETURNING parent_task, start_date, hours_remaining"""
+        params = (hours_delta,) * 4 + (task_id,)
     else:
-        # Scale all phases proportionally
-        scale_factor = (
-            (task["work_hours"] + hours_delta) / task["work_hours"]
-            if task["work_hours"] > 0
-            else 1
-        )
-        updates = {
-            "dev_hours": round(task["dev_hours"] * scale_factor, 1),
-            "test_hours": round(task["test_hours"] * scale_factor, 1),
-            "review_hours": round(task["review_hours"] * scale_factor, 1),
-            "work_hours": round(task["work_hours"] + hours_delta, 1),
-        }
+        # Scale all phases proportionally (phases untouched if work_hours is 0)
+        sql = f"""UPDATE tasks SET
+            dev_hours = COALESCE(ROUND(dev_hours * (work_hours + ?) / NULLIF(work_hours, 0), 1), dev_hours),
+            test_hours = COALESCE(ROUND(test_hours * (work_hours + ?) / NULLIF(work_hours, 0), 1), test_hours),
+            review_hours = COALESCE(ROUND(review_hours * (work_hours + ?) / NULLIF(work_hours, 0), 1), review_hours),
+            work_hours = ROUND(work_hours + ?, 1),
+            {derived_sql}
+            WHERE id = ?
+            RETURNING parent_task, start_date, hours_remaining"""
+        params = (hours_delta,) * 6 + (task_id,)
 
-    return update_task(task_id, updates)
+    with get_db() as conn:
+        row = conn.execute(sql, params).fetchone()
+        # Match update_task: a work_hours change moves the finish date to
+        # cover the remaining hours, unless the task is already complete
+        if row and row["start_date"] and row["hours_remaining"] > 0:
+            new_finish = recalculate_finish_date(
+                row["start_date"], row["hours_remaining"]
+            )
+            if new_finish:
+                conn.execute(
+                    "UPDATE tasks SET finish_date = ? WHERE id = ?",
+                    (new_finish, task_id),
+                )
+        conn.commit()
+
+    _invalidate_scurve_cache()
+
+    if row and row["parent_task"]:
+        update_parent_task_totals(row["parent_task"])
+
+    return get_task(task_id)
 
 
 # ============================================================================
@@ -1007,7 +1558,7 @@ def get_timeline_data():
 
 def get_all_dependencies():
     """Get all task dependencies."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         rows = conn.execute(
             """SELECT d.*, 
                       p.task as predecessor_name, p.resource as predecessor_resource,
@@ -1060,7 +1611,7 @@ def remove_dependency(dep_id: int):
 
 def get_all_milestones():
     """Get all milestones."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         rows = conn.execute("SELECT * FROM milestones ORDER BY date").fetchall()
         return [dict(r) for r in rows]
 
@@ -1086,9 +1637,6 @@ def remove_milestone(milestone_id: int):
 
 def get_labor_forecast(months_ahead: int = 12):
     """Calculate labor forecast: hours per resource per month for the next N months."""
-    from datetime import datetime, timedelta
-    import calendar
-
     tasks = get_all_tasks()
     resources = get_resources()
     today = datetime.now()
@@ -1151,8 +1699,6 @@ def get_labor_forecast(months_ahead: int = 12):
 
 def get_resource_load(weeks_ahead: int = 8):
     """Get weekly resource load for overload detection."""
-    from datetime import datetime, timedelta
-
     tasks = get_all_tasks()
     resources = get_resources()
     today = datetime.now()
@@ -1335,7 +1881,7 @@ def save_baseline_snapshot(
 
 def get_baseline_snapshots() -> list:
     """List all saved baseline snapshots (metadata only — no data blob)."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         rows = conn.execute(
             """SELECT id, snapshot_name, snapshot_date, snapshot_type, created_at
                FROM baseline_snapshots ORDER BY created_at DESC"""
@@ -1345,7 +1891,7 @@ def get_baseline_snapshots() -> list:
 
 def get_baseline_snapshot(snapshot_id: int) -> dict | None:
     """Load a single snapshot including its full data."""
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         row = conn.execute(
             "SELECT * FROM baseline_snapshots WHERE id = ?", (snapshot_id,)
         ).fetchone()
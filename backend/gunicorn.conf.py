@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration
+=======================
+Run: gunicorn main:app -c gunicorn.conf.py
+
+Multiple uvicorn workers spread requests across cores; SQLite in WAL mode
+handles the multi-process readers/writer coordination, and cache
+generations / ETag counters live in the database's meta table so a write
+through one worker invalidates what its siblings have cached.
+"""
+
+import os
+
+# Bind to localhost when fronted by nginx (see nginx.conf); the container
+# keeps the default so the published port still works
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = os.cpu_count() * 2 + 1
+worker_connections = 1000
+keepalive = 5
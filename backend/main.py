@@ -6,41 +6,88 @@ Modern async API replacing http.server.
 Run: uvicorn main:app --reload --port 8000
 """
 
-from fastapi import FastAPI, HTTPException
+import fcntl
+import functools
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, List
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Annotated, Dict, Literal, Optional, List
 import database
 import ai_service
 from database import CR_STAGE_MAP
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize database on startup."""
+    database.init_db()
+    database.warm_connection_pool()
+    database.start_checkpoint_thread()
+
+    # Auto-migrate once: a sentinel row short-circuits subsequent boots
+    # (and other workers) without scanning tasks, and an exclusive lock on
+    # the CSV makes sure only one worker performs the migration
+    csv_path = Path(__file__).parent.parent / "projects.csv"
+    if database.get_meta("migrated") is None and csv_path.exists():
+        with open(csv_path, "r", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if database.get_meta("migrated") is None:
+                    if not database.has_tasks():
+                        print("Empty database, migrating from CSV...")
+                        database.migrate_from_csv(csv_path)
+                    database.set_meta("migrated", "1")
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    yield
+
+    # Shutdown: leave a truncated WAL behind and release all connections
+    database.checkpoint_db()
+    database.close_connections()
+
+
 # Initialize
 app = FastAPI(
     title="KPI Project Tracker API",
     description="API for managing project tasks with AI assistance",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# CORS for React frontend
+# CORS for React frontend — one compiled regex instead of a linear scan
+# over an origin list on every preflight
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",
-        "http://localhost:5174",
-        "http://localhost:3000",
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:5174",
-    ],
+    allow_origin_regex=r"^http://(localhost|127\.0\.0\.1):(3000|5173|5174)$",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress the large JSON payloads (timeline, s-curve, forecasts); responses
+# under 1 KB skip compression so tiny endpoints don't pay the overhead
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
 
 # === Models ===
 
 
-class TaskUpdate(BaseModel):
+class StrictModel(BaseModel):
+    """Request-body base: reject unknown fields, immutable once validated."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True, validate_assignment=False)
+
+
+class TaskUpdate(StrictModel):
     task: Optional[str] = None
     resource: Optional[str] = None
     work_hours: Optional[float] = None
@@ -59,149 +106,349 @@ class TaskUpdate(BaseModel):
     hours_remaining: Optional[float] = None
 
 
-class ChatMessage(BaseModel):
+class BulkTaskUpdate(StrictModel):
+    updates: Dict[int, TaskUpdate]  # task id -> fields to change
+
+
+class ChatMessage(StrictModel):
     role: str  # 'user' or 'assistant'
     content: str
 
 
-class ChatRequest(BaseModel):
+class ChatRequest(StrictModel):
     query: str
     history: Optional[List[ChatMessage]] = None  # Previous conversation messages
 
 
-class ConfirmActionRequest(BaseModel):
+class ConfirmActionRequest(StrictModel):
     action_id: int
     chosen_option: int  # 1, 2, or 3
 
 
+class StageUpdate(StrictModel):
+    # Keys of database.CR_STAGE_MAP; pydantic rejects anything else with a
+    # 422 before the handler runs
+    stage: Literal["submitted", "analyzed", "implemented", "review", "resolved"]
+
+
+# Built once so the PATCH hot path dumps through a ready pydantic-core
+# serializer instead of re-resolving one inside model_dump each call
+_TASK_UPDATE_ADAPTER = TypeAdapter(TaskUpdate)
+
+
+# === Response cache ===
+#
+# Read-heavy GET endpoints recompute aggregations whose inputs change at
+# most a few times per minute. Cache their results in-process for a short
+# TTL, keyed by endpoint and arguments, and clear the cache from every
+# mutating endpoint. /api/chat is never cached.
+
+_RESPONSE_TTL_SECONDS = 60
+_RESPONSE_CACHE_MAX = 256
+_response_cache: dict = {}
+
+
+def cache_response(func):
+    """Cache an async endpoint's result for _RESPONSE_TTL_SECONDS.
+
+    Keys embed the shared task write generation so that a write handled
+    by any gunicorn worker invalidates every sibling's entries too —
+    _invalidate_response_cache() only reaches the worker that performed
+    the write. The size cap covers what generation keying strands:
+    entries under old generations and cold what-if argument combinations.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        version = database.tasks_version()
+        key = (func.__name__, version, args, tuple(sorted(kwargs.items())))
+        entry = _response_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        result = await func(*args, **kwargs)
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+            now = time.monotonic()
+            stale = [
+                k
+                for k, (deadline, _) in _response_cache.items()
+                if deadline <= now or k[1] != version
+            ]
+            for k in stale:
+                del _response_cache[k]
+            if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+                _response_cache.clear()
+        _response_cache[key] = (time.monotonic() + _RESPONSE_TTL_SECONDS, result)
+        return result
+
+    return wrapper
+
+
+def _invalidate_response_cache():
+    """Drop all cached responses after any write."""
+    _response_cache.clear()
+
+
+# === ETags for rarely-changing GETs ===
+#
+# Each domain has a version counter bumped by its mutating endpoints. The
+# counters live in the meta table, not in the process: with several
+# gunicorn workers a local counter only moves in the worker that handled
+# the write, and any sibling keeps confirming the stale ETag with a false
+# 304. Persisting them also makes pre-restart ETags safe — they match
+# only if the domain genuinely has not changed.
+
+
+def _domain_etag(domain: str) -> str:
+    version = database.get_meta(f"etag-{domain}") or "0"
+    return f'W/"{domain}-{version}"'
+
+
+def _bump_domain(domain: str):
+    database.bump_meta_counter(f"etag-{domain}")
+
+
 # === Endpoints ===
+#
+# Handlers are async so the single event loop stays in control of
+# scheduling; blocking database/AI work is offloaded explicitly through
+# run_in_threadpool rather than relying on FastAPI's implicit threadpool
+# for whole requests.
 
 
 @app.get("/")
-def root():
+async def root():
     return {"status": "ok", "message": "KPI Tracker API v2.0"}
 
 
 @app.get("/api/tasks")
-def get_tasks():
+async def get_tasks():
     """Get all tasks."""
-    return database.get_all_tasks()
+    return await run_in_threadpool(database.get_all_tasks)
+
+
+def _task_rows_ndjson():
+    """Yield tasks as NDJSON chunks straight off the cursor."""
+    with database.get_db(readonly=True) as conn:
+        cursor = conn.execute("SELECT * FROM tasks ORDER BY id")
+        cursor.row_factory = None
+        columns = [d[0] for d in cursor.description]
+        while True:
+            rows = cursor.fetchmany(200)
+            if not rows:
+                break
+            yield b"".join(
+                orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows
+            )
+
+
+@app.get("/api/tasks/stream")
+async def stream_tasks():
+    """Stream all tasks as NDJSON, one object per line.
+
+    Serializes per fetchmany batch instead of materializing the whole task
+    list, keeping peak memory at O(chunk) for bulk consumers.
+    """
+    return StreamingResponse(_task_rows_ndjson(), media_type="application/x-ndjson")
 
 
 @app.get("/api/tasks/{task_id}")
-def get_task(task_id: int):
+async def get_task(task_id: int):
     """Get single task."""
-    task = database.get_task(task_id)
+    task = await run_in_threadpool(database.get_task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 
+@app.patch("/api/tasks/bulk")
+async def update_tasks_bulk(body: BulkTaskUpdate):
+    """Update several tasks in one request and one transaction.
+
+    Multi-row edits (e.g. dragging multiple Gantt bars) otherwise cost one
+    round-trip, one preflight and one commit per task.
+    """
+    updates_by_id = {
+        task_id: _TASK_UPDATE_ADAPTER.dump_python(task_update, exclude_none=True)
+        for task_id, task_update in body.updates.items()
+    }
+    updates_by_id = {k: v for k, v in updates_by_id.items() if v}
+    if not updates_by_id:
+        raise HTTPException(status_code=400, detail="No fields to update")
+
+    results = await run_in_threadpool(database.bulk_update_tasks, updates_by_id)
+    if not results:
+        raise HTTPException(status_code=404, detail="No matching tasks found")
+    _invalidate_response_cache()
+    return {"updated": results}
+
+
 @app.patch("/api/tasks/{task_id}")
-def update_task(task_id: int, updates: TaskUpdate):
+async def update_task(task_id: int, updates: TaskUpdate):
     """Update a task."""
-    update_dict = updates.model_dump(exclude_none=True)
+    update_dict = _TASK_UPDATE_ADAPTER.dump_python(updates, exclude_none=True)
     if not update_dict:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    # Get old values for logging
-    old_task = database.get_task(task_id)
-    if not old_task:
+    result = await run_in_threadpool(
+        database.update_task_logged, task_id, update_dict
+    )
+    if result is None:
         raise HTTPException(status_code=404, detail="Task not found")
-
-    # Apply updates
-    result = database.update_task(task_id, update_dict)
-
-    # Log changes
-    for field, new_val in update_dict.items():
-        old_val = old_task.get(field, "?")
-        database.log_change(
-            "EDIT",
-            old_task["task"],
-            old_task["resource"],
-            f"{field}: {old_val} → {new_val}",
-        )
-
+    _invalidate_response_cache()
     return result
 
 
 @app.get("/api/summary")
-def get_summary():
+async def get_summary():
     """Get summary statistics."""
-    return database.get_summary()
+    return await run_in_threadpool(database.get_summary)
 
 
 @app.get("/api/scurve")
-def get_scurve():
+async def get_scurve():
     """Get S-curve data."""
-    return database.get_scurve_data()
+    # Pre-built response skips the jsonable_encoder pass on a large payload
+    return ORJSONResponse(await run_in_threadpool(database.get_scurve_data))
 
 
 @app.get("/api/scurve/{project_name}")
-def get_project_scurve(project_name: str):
+async def get_project_scurve(project_name: str):
     """Get S-curve data for a specific project."""
-    return database.get_project_scurve_data(project_name)
+    return await run_in_threadpool(database.get_project_scurve_data, project_name)
 
 
 @app.get("/api/resources")
-def get_resources():
+async def get_resources(request: Request):
     """Get all resources."""
-    return database.get_resources()
+    etag = _domain_etag("resources")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    data = await run_in_threadpool(database.get_resources)
+    return ORJSONResponse(data, headers={"ETag": etag})
 
 
 @app.get("/api/resource-allocation")
-def get_resource_allocation():
+@cache_response
+async def get_resource_allocation():
     """Get MS Project-style resource allocation data with capacity, allocation, and utilization."""
-    return database.get_resource_allocation()
+    return await run_in_threadpool(database.get_resource_allocation)
 
 
 @app.get("/api/changelog")
-def get_changelog(limit: int = 50):
+async def get_changelog(limit: Annotated[int, Query(ge=1, le=500)] = 50):
     """Get recent changelog."""
-    return database.get_changelog(limit)
+    return await run_in_threadpool(database.get_changelog, limit)
+
+
+# Re-asked questions skip the LLM round-trip: answers to pure queries are
+# cached by (query, recent history, task write generation) so any task
+# change invalidates them. Side-effecting replies are never cached. The
+# size cap matters because generation-keyed entries are stranded rather
+# than evicted by writes: without it a long-lived worker leaks one entry
+# per unique question per write generation.
+_CHAT_CACHE_TTL_SECONDS = 600
+_CHAT_CACHE_MAX = 256
+_chat_cache: dict = {}
+
+
+def _chat_cache_key(query: str, history) -> str:
+    digest = hashlib.blake2b(query.encode(), digest_size=16)
+    for message in (history or [])[-6:]:
+        digest.update(message["role"].encode())
+        digest.update(b"\x00")
+        digest.update(message["content"].encode())
+        digest.update(b"\x01")
+    return digest.hexdigest()
+
+
+def _chat_result_is_pure(result: dict) -> bool:
+    """Only answers that changed nothing and need no follow-up are cacheable."""
+    return (
+        result.get("success")
+        and not result.get("changes_count")
+        and not result.get("needs_clarification")
+        and not result.get("needs_confirmation")
+    )
 
 
 @app.post("/api/chat")
-def chat(request: ChatRequest):
+async def chat(request: ChatRequest):
     """Process AI chat request."""
-    # Convert history to format expected by ai_service
-    history = None
-    if request.history:
-        history = [{"role": m.role, "content": m.content} for m in request.history]
+    # One model_dump in pydantic-core converts the whole history to dicts,
+    # instead of a Python-level loop over every message
+    history = request.model_dump()["history"] if request.history else None
+
+    key = (_chat_cache_key(request.query, history), database.tasks_version())
+    entry = _chat_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
 
-    result = ai_service.chat(request.query, history=history)
+    result = await run_in_threadpool(ai_service.chat, request.query, history)
     if not result["success"]:
         raise HTTPException(status_code=500, detail=result.get("message", "AI error"))
+
+    # Chat is the one mutating path that isn't a dedicated endpoint: if
+    # the AI applied edits, drop cached responses like every other write
+    if result.get("changes_count"):
+        _invalidate_response_cache()
+
+    if _chat_result_is_pure(result):
+        if len(_chat_cache) >= _CHAT_CACHE_MAX:
+            # Expired and stranded-generation entries first; flush outright
+            # only if live same-generation answers alone fill the cache
+            now = time.monotonic()
+            stale = [
+                k
+                for k, (deadline, _) in _chat_cache.items()
+                if deadline <= now or k[1] != key[1]
+            ]
+            for k in stale:
+                del _chat_cache[k]
+            if len(_chat_cache) >= _CHAT_CACHE_MAX:
+                _chat_cache.clear()
+        _chat_cache[key] = (time.monotonic() + _CHAT_CACHE_TTL_SECONDS, result)
     return result
 
 
 @app.post("/api/confirm-action")
-def confirm_action(request: ConfirmActionRequest):
+async def confirm_action(request: ConfirmActionRequest):
     """Confirm a pending action with chosen option."""
-    result = ai_service.confirm_action(request.action_id, request.chosen_option)
+    result = await run_in_threadpool(
+        ai_service.confirm_action, request.action_id, request.chosen_option
+    )
     if not result["success"]:
         raise HTTPException(
             status_code=400, detail=result.get("message", "Failed to execute action")
         )
+    _invalidate_response_cache()
     return result
 
 
 # === Timeline / Gantt Endpoints ===
 
 
+@cache_response
+async def _timeline_data():
+    return await run_in_threadpool(database.get_timeline_data)
+
+
 @app.get("/api/timeline")
-def get_timeline():
+async def get_timeline():
     """Get all timeline/Gantt data (tasks, dependencies, milestones)."""
-    return database.get_timeline_data()
+    # Cache the payload but build a fresh Response per request:
+    # GZipMiddleware mutates the response's header list in place, so a
+    # shared cached instance ends up advertising gzip over a plain body.
+    # ORJSONResponse still skips the jsonable_encoder pass.
+    return ORJSONResponse(await _timeline_data())
 
 
 @app.get("/api/dependencies")
-def get_dependencies():
+async def get_dependencies():
     """Get all task dependencies."""
-    return database.get_all_dependencies()
+    return await run_in_threadpool(database.get_all_dependencies)
 
 
-class DependencyCreate(BaseModel):
+class DependencyCreate(StrictModel):
     predecessor_id: int
     successor_id: int
     dependency_type: str = "FS"
@@ -209,30 +456,40 @@ class DependencyCreate(BaseModel):
 
 
 @app.post("/api/dependencies")
-def create_dependency(dep: DependencyCreate):
+async def create_dependency(dep: DependencyCreate):
     """Add a dependency between two tasks."""
-    result = database.add_dependency(
-        dep.predecessor_id, dep.successor_id, dep.dependency_type, dep.lag_days
+    result = await run_in_threadpool(
+        database.add_dependency,
+        dep.predecessor_id,
+        dep.successor_id,
+        dep.dependency_type,
+        dep.lag_days,
     )
     if not result:
         raise HTTPException(status_code=404, detail="One or both tasks not found")
+    _invalidate_response_cache()
     return result
 
 
 @app.delete("/api/dependencies/{dep_id}")
-def delete_dependency(dep_id: int):
+async def delete_dependency(dep_id: int):
     """Remove a dependency."""
-    database.remove_dependency(dep_id)
+    await run_in_threadpool(database.remove_dependency, dep_id)
+    _invalidate_response_cache()
     return {"success": True}
 
 
 @app.get("/api/milestones")
-def get_milestones():
+async def get_milestones(request: Request):
     """Get all milestones."""
-    return database.get_all_milestones()
+    etag = _domain_etag("milestones")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    data = await run_in_threadpool(database.get_all_milestones)
+    return ORJSONResponse(data, headers={"ETag": etag})
 
 
-class MilestoneCreate(BaseModel):
+class MilestoneCreate(StrictModel):
     name: str
     date: str
     color: str = "#9333ea"
@@ -240,144 +497,182 @@ class MilestoneCreate(BaseModel):
 
 
 @app.post("/api/milestones")
-def create_milestone(ms: MilestoneCreate):
+async def create_milestone(ms: MilestoneCreate):
     """Add a milestone."""
-    return database.add_milestone(ms.name, ms.date, ms.color, ms.description)
+    result = await run_in_threadpool(
+        database.add_milestone, ms.name, ms.date, ms.color, ms.description
+    )
+    _invalidate_response_cache()
+    _bump_domain("milestones")
+    return result
 
 
 @app.delete("/api/milestones/{milestone_id}")
-def delete_milestone(milestone_id: int):
+async def delete_milestone(milestone_id: int):
     """Remove a milestone."""
-    database.remove_milestone(milestone_id)
+    await run_in_threadpool(database.remove_milestone, milestone_id)
+    _invalidate_response_cache()
+    _bump_domain("milestones")
     return {"success": True}
 
 
 @app.get("/api/labor-forecast")
-def get_labor_forecast(months: int = 12):
+@cache_response
+async def get_labor_forecast(months: Annotated[int, Query(ge=1, le=36)] = 12):
     """Get 12-month labor forecast by resource."""
-    return database.get_labor_forecast(months)
+    return await run_in_threadpool(database.get_labor_forecast, months)
 
 
 @app.get("/api/resource-load")
-def get_resource_load(weeks: int = 8):
+@cache_response
+async def get_resource_load(weeks: Annotated[int, Query(ge=1, le=52)] = 8):
     """Get weekly resource load for overload detection."""
-    return database.get_resource_load(weeks)
+    return await run_in_threadpool(database.get_resource_load, weeks)
 
 
 # === CR Lifecycle Stage ===
 
 
-@app.patch("/api/tasks/{task_id}/stage")
-def update_task_stage(task_id: int, body: dict):
-    """Update the CR lifecycle stage of a task."""
-    stage = body.get("stage", "").lower()
-    if stage not in CR_STAGE_MAP:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid stage. Must be one of: {list(CR_STAGE_MAP.keys())}",
-        )
+def _update_task_stage_sync(task_id: int, stage: str):
+    """Blocking body of the stage PATCH handler."""
     result = database.update_cr_stage(task_id, stage)
     if not result:
-        raise HTTPException(status_code=404, detail="Task not found")
+        return None
 
-    old_task = database.get_task(task_id)
-    database.log_change("STAGE", result["task"], result.get("resource", ""), f"Stage → {stage}")
+    database.log_change(
+        "STAGE", result["task"], result.get("resource", ""), f"Stage → {stage}"
+    )
+    return result
+
+
+@app.patch("/api/tasks/{task_id}/stage")
+async def update_task_stage(task_id: int, body: StageUpdate):
+    """Update the CR lifecycle stage of a task."""
+    result = await run_in_threadpool(_update_task_stage_sync, task_id, body.stage)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    _invalidate_response_cache()
     return result
 
 
 @app.get("/api/cr-stages")
-def get_cr_stages():
+async def get_cr_stages(request: Request):
     """Return the CR stage map with suggested percentages."""
-    return CR_STAGE_MAP
+    etag = _domain_etag("cr-stages")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return ORJSONResponse(CR_STAGE_MAP, headers={"ETag": etag})
 
 
 # === Mismatch Warnings ===
 
 
 @app.get("/api/mismatch-warnings")
-def get_mismatch_warnings():
+@cache_response
+async def get_mismatch_warnings():
     """Get tasks with hours-vs-progress mismatch."""
-    return database.get_mismatch_warnings()
+    return await run_in_threadpool(database.get_mismatch_warnings)
 
 
 # === Baseline Snapshots ===
 
 
-class BaselineCreate(BaseModel):
+class BaselineCreate(StrictModel):
     name: str
     snapshot_type: str = "manual"  # initial, monthly, manual
 
 
 @app.post("/api/baselines")
-def create_baseline(body: BaselineCreate):
+async def create_baseline(body: BaselineCreate):
     """Save a project baseline snapshot."""
-    return database.save_baseline_snapshot(body.name, body.snapshot_type)
+    result = await run_in_threadpool(
+        database.save_baseline_snapshot, body.name, body.snapshot_type
+    )
+    _bump_domain("baselines")
+    return result
 
 
 @app.get("/api/baselines")
-def list_baselines():
+async def list_baselines(request: Request):
     """List all saved baselines."""
-    return database.get_baseline_snapshots()
+    etag = _domain_etag("baselines")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    data = await run_in_threadpool(database.get_baseline_snapshots)
+    return ORJSONResponse(data, headers={"ETag": etag})
 
 
 @app.get("/api/baselines/{snapshot_id}")
-def get_baseline(snapshot_id: int):
+async def get_baseline(snapshot_id: int):
     """Get a single baseline snapshot with full data."""
-    snap = database.get_baseline_snapshot(snapshot_id)
+    snap = await run_in_threadpool(database.get_baseline_snapshot, snapshot_id)
     if not snap:
         raise HTTPException(status_code=404, detail="Snapshot not found")
     return snap
 
 
 @app.get("/api/baselines/{snapshot_id}/compare")
-def compare_baseline(snapshot_id: int):
+async def compare_baseline(snapshot_id: int):
     """Compare current state against a saved baseline."""
-    result = database.compare_baseline(snapshot_id)
+    result = await run_in_threadpool(database.compare_baseline, snapshot_id)
     if "error" in result:
         raise HTTPException(status_code=404, detail=result["error"])
     return result
 
 
 @app.delete("/api/baselines/{snapshot_id}")
-def delete_baseline(snapshot_id: int):
+async def delete_baseline(snapshot_id: int):
     """Delete a baseline snapshot."""
-    database.delete_baseline_snapshot(snapshot_id)
+    await run_in_threadpool(database.delete_baseline_snapshot, snapshot_id)
+    _bump_domain("baselines")
     return {"success": True}
 
 
 # === What-If Scenarios ===
 
 
-class WhatIfRemoveResource(BaseModel):
+class WhatIfRemoveResource(StrictModel):
     resource: str
     redistribute: bool = True
 
 
-class WhatIfSlipSchedule(BaseModel):
+class WhatIfSlipSchedule(StrictModel):
     weeks: int = 2
 
 
-class WhatIfAddHours(BaseModel):
+class WhatIfAddHours(StrictModel):
     task_id: int
     extra_hours: float
 
 
+# The simulations are pure reads, and the frozen request models hash by
+# value, so identical runs coalesce through the response cache until the
+# next write clears it
+
+
 @app.post("/api/what-if/remove-resource")
-def what_if_remove_resource(body: WhatIfRemoveResource):
+@cache_response
+async def what_if_remove_resource(body: WhatIfRemoveResource):
     """Simulate removing a resource from the project."""
-    return database.what_if_remove_resource(body.resource, body.redistribute)
+    return await run_in_threadpool(
+        database.what_if_remove_resource, body.resource, body.redistribute
+    )
 
 
 @app.post("/api/what-if/slip-schedule")
-def what_if_slip_schedule(body: WhatIfSlipSchedule):
+@cache_response
+async def what_if_slip_schedule(body: WhatIfSlipSchedule):
     """Simulate slipping all unfinished tasks by N weeks."""
-    return database.what_if_slip_schedule(body.weeks)
+    return await run_in_threadpool(database.what_if_slip_schedule, body.weeks)
 
 
 @app.post("/api/what-if/add-hours")
-def what_if_add_hours(body: WhatIfAddHours):
+@cache_response
+async def what_if_add_hours(body: WhatIfAddHours):
     """Simulate adding hours to a task."""
-    result = database.what_if_add_hours(body.task_id, body.extra_hours)
+    result = await run_in_threadpool(
+        database.what_if_add_hours, body.task_id, body.extra_hours
+    )
     if not result:
         raise HTTPException(status_code=404, detail="Task not found")
     return result
@@ -387,31 +682,15 @@ def what_if_add_hours(body: WhatIfAddHours):
 
 
 @app.get("/api/management-timeline")
-def get_management_timeline():
+@cache_response
+async def get_management_timeline():
     """High-level project timeline for management view."""
-    return database.get_management_timeline()
-
-
-# === Startup ===
-
-
-@app.on_event("startup")
-def startup():
-    """Initialize database on startup."""
-    database.init_db()
-
-    # Auto-migrate if DB is empty but CSV exists
-    from pathlib import Path
-
-    csv_path = Path(__file__).parent.parent / "projects.csv"
-    if csv_path.exists():
-        tasks = database.get_all_tasks()
-        if not tasks:
-            print("Empty database, migrating from CSV...")
-            database.migrate_from_csv(csv_path)
+    return await run_in_threadpool(database.get_management_timeline)
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvicorn[standard] ships uvloop and httptools; pin them explicitly so
+    # the standalone entrypoint matches the gunicorn workers
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
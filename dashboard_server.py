@@ -10,17 +10,23 @@ Usage:
 Then open: http://localhost:8080
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import copy
+import gzip
+import hashlib
+import html
 import json
 import csv
+import math
 import os
 import webbrowser
 from datetime import datetime, timedelta
 from pathlib import Path
 from urllib.parse import parse_qs
-import urllib.request
-import urllib.error
+import atexit
+import http.client
 import threading
+import time
 
 # Configuration
 PORT = 8080
@@ -38,14 +44,200 @@ if (SCRIPT_DIR / ".env").exists():
                 os.environ[k] = v
 
 
+# JSON codec: orjson (C extension, ~3-5x faster, compact output) when
+# available, otherwise stdlib json with whitespace-free separators. The
+# script stays runnable with no third-party packages either way.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+
+# Serializes CSV read-modify-write cycles now that requests run on
+# worker threads
+_CSV_LOCK = threading.Lock()
+
+# Parsed-CSV cache: a single chat request re-reads projects.csv three or
+# four times (context build, dashboard render, apply). Keyed on the file's
+# mtime, so edits made outside the server still show up.
+_projects_cache = {"mtime": -1, "rows": None}
+
+# Write coalescing: a slider drag fires a burst of /update POSTs, each of
+# which used to rewrite the whole CSV. Edits now mutate the cached rows
+# immediately and a short re-armed timer writes the file once per burst.
+_FLUSH_DELAY = 0.1
+_pending = {"timer": None, "dirty": False, "log": {}}
+
+
+def _current_rows():
+    """In-memory project rows, no copy. Caller must hold _CSV_LOCK.
+
+    While a flush is pending the cached rows are ahead of the file, so
+    the mtime check is skipped — memory is the source of truth.
+    """
+    if not _pending["dirty"]:
+        mtime = os.stat(PROJECTS_FILE).st_mtime_ns
+        if mtime != _projects_cache["mtime"]:
+            with open(PROJECTS_FILE, "r", newline="", encoding="utf-8") as f:
+                _projects_cache["rows"] = list(csv.DictReader(f))
+            # ID index built once per parse; edits mutate rows in place so
+            # the index stays valid between reloads
+            _projects_cache["by_id"] = {p["ID"]: p for p in _projects_cache["rows"]}
+            # Baselines rarely change: parse them to float once instead of
+            # re-parsing the string on every Work_Hours edit
+            baselines = {}
+            for p in _projects_cache["rows"]:
+                try:
+                    baselines[p["ID"]] = float(p["Baseline_Hours"])
+                except (KeyError, ValueError):
+                    baselines[p["ID"]] = 0.0
+            _projects_cache["baselines"] = baselines
+            # Integer views of the numeric columns, converted once here
+            # instead of four int(float(...)) parses per row per render;
+            # the edit paths keep these in sync
+            _projects_cache["nums"] = {
+                p["ID"]: {
+                    "work": int(float(p["Work_Hours"])),
+                    "baseline": int(float(p["Baseline_Hours"])),
+                    "variance": int(float(p["Variance"])),
+                    "percent": int(float(p["Percent_Complete"])),
+                }
+                for p in _projects_cache["rows"]
+            }
+            # Running totals behind the edit-response summary; the edit
+            # paths apply deltas so re-summing only happens on a reload
+            agg = {"work": 0.0, "baseline": 0.0, "percent": 0.0, "count": 0}
+            for p in _projects_cache["rows"]:
+                agg["work"] += float(p["Work_Hours"])
+                agg["baseline"] += float(p["Baseline_Hours"])
+                agg["percent"] += float(p["Percent_Complete"])
+                agg["count"] += 1
+            _projects_cache["agg"] = agg
+            _projects_cache["mtime"] = mtime
+    return _projects_cache["rows"]
+
+
+def _row_by_id(task_id):
+    """Row dict for a task id (int or str). Caller must hold _CSV_LOCK."""
+    _current_rows()
+    return _projects_cache["by_id"].get(str(task_id))
+
+
 def load_projects():
-    """Load projects from CSV."""
-    projects = []
-    with open(PROJECTS_FILE, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            projects.append(row)
-    return projects
+    """Load projects from CSV (cached while the file is unchanged).
+
+    Returns a deep copy so callers can mutate rows without corrupting
+    the cache.
+    """
+    with _CSV_LOCK:
+        return copy.deepcopy(_current_rows())
+
+
+def _schedule_flush():
+    """(Re-)arm the burst flush timer. Caller must hold _CSV_LOCK."""
+    _pending["dirty"] = True
+    if _pending["timer"] is not None:
+        _pending["timer"].cancel()
+    timer = threading.Timer(_FLUSH_DELAY, _flush_pending)
+    timer.daemon = True
+    timer.start()
+    _pending["timer"] = timer
+
+
+def _record_edit(task, field, old_value, value):
+    """Queue a changelog row for the burst. Caller must hold _CSV_LOCK.
+
+    Keyed on (task id, field): within one burst only the final value is
+    logged, as one row spanning first old value to last new value.
+    """
+    key = (task["ID"], field)
+    entry = _pending["log"].get(key)
+    if entry is None:
+        _pending["log"][key] = [task["Task"], task["Resource"], field, old_value, value]
+    else:
+        entry[4] = value
+
+
+def _flush_pending():
+    """Write coalesced edits to disk (timer callback and shutdown hook)."""
+    with _CSV_LOCK:
+        if not _pending["dirty"]:
+            return
+        _pending["dirty"] = False
+        _pending["timer"] = None
+        edits = list(_pending["log"].values())
+        _pending["log"].clear()
+        save_projects(_projects_cache["rows"])
+        _truncate_journal()
+    for task_name, resource, field, old, new in edits:
+        log_change("EDIT", task_name, resource, f"{field}: {old} → {new}")
+
+
+# Crash-recovery journal: between an edit and the burst flush the edited
+# rows exist only in memory. Each applied edit is also appended here as a
+# one-line JSON record (a tiny sequential write, nothing like the full
+# CSV rewrite), the file is dropped once the flush lands, and any records
+# left over after a crash are replayed at startup.
+_JOURNAL_FILE = SCRIPT_DIR / "projects.journal"
+_journal_fh = None
+
+
+def _journal_write(change):
+    """Append one edit record to the journal. Caller must hold _CSV_LOCK."""
+    global _journal_fh
+    if _journal_fh is None:
+        _journal_fh = open(_JOURNAL_FILE, "ab")
+    _journal_fh.write(_dumps(change) + b"\n")
+    _journal_fh.flush()
+
+
+def _truncate_journal():
+    """Discard the journal once the CSV has caught up. Caller holds _CSV_LOCK."""
+    global _journal_fh
+    if _journal_fh is not None:
+        _journal_fh.close()
+        _journal_fh = None
+    try:
+        os.remove(_JOURNAL_FILE)
+    except OSError:
+        pass
+
+
+def _replay_journal():
+    """Re-apply edits journaled before an unclean shutdown, then save."""
+    if not os.path.exists(_JOURNAL_FILE) or os.path.getsize(_JOURNAL_FILE) == 0:
+        return
+    with _CSV_LOCK:
+        with open(_JOURNAL_FILE, "rb") as f:
+            records = f.read().splitlines()
+        applied = 0
+        for record in records:
+            if not record:
+                continue
+            # A record that can't be parsed or applied is skipped, not
+            # fatal: a poison entry must never block server startup
+            try:
+                change = _loads(record)
+                if _apply_field_edit(change["id"], change["field"], change["value"]):
+                    applied += 1
+            except (KeyError, TypeError, ValueError):
+                continue
+        # The edits were changelog-logged when first made; don't log twice
+        _pending["log"].clear()
+        if applied:
+            save_projects(_projects_cache["rows"])
+        _truncate_journal()
+    if applied:
+        print(f"Recovered {applied} unsaved edit(s) from journal")
 
 
 def save_projects(projects):
@@ -53,58 +245,181 @@ def save_projects(projects):
     if not projects:
         return
     fieldnames = projects[0].keys()
-    with open(PROJECTS_FILE, "w", newline="", encoding="utf-8") as f:
+    # Write to a sibling temp file and rename into place: a crash
+    # mid-write leaves the old CSV intact instead of a truncated one.
+    # Large block buffer: the whole file accumulates in memory and goes
+    # out in one write on close instead of a syscall per buffered chunk
+    tmp_file = str(PROJECTS_FILE) + ".tmp"
+    with open(tmp_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(projects)
+    os.replace(tmp_file, PROJECTS_FILE)
+    # Force a re-read rather than trusting mtime granularity
+    _projects_cache["mtime"] = -1
+
+
+# Long-lived changelog handle: appending used to cost an open/write/close
+# per edit (~60 opens/sec under a drag storm). The file is opened once on
+# first use, writes go through the 8 KB buffer, and a daemon thread flushes
+# it every 200 ms so the on-disk log never lags far behind.
+_changelog_fh = None
+_changelog_lock = threading.Lock()
+_CHANGELOG_FLUSH_SECS = 0.2
+
+
+def _changelog_handle():
+    """Open (once) and return the append handle. Caller holds _changelog_lock."""
+    global _changelog_fh
+    if _changelog_fh is None:
+        new_file = not os.path.exists(CHANGELOG_FILE)
+        _changelog_fh = open(CHANGELOG_FILE, "a", encoding="utf-8", buffering=8192)
+        if new_file:
+            _changelog_fh.write("# Project Changelog\n\n")
+            _changelog_fh.write("| Timestamp | Action | Task | Resource | Details |\n")
+            _changelog_fh.write("|-----------|--------|------|----------|--------|\n")
+        atexit.register(_close_changelog)
+        threading.Thread(target=_changelog_flusher, daemon=True).start()
+    return _changelog_fh
+
+
+def _changelog_flusher():
+    while True:
+        time.sleep(_CHANGELOG_FLUSH_SECS)
+        with _changelog_lock:
+            if _changelog_fh is None:
+                return
+            _changelog_fh.flush()
+
+
+def _flush_changelog():
+    with _changelog_lock:
+        if _changelog_fh is not None:
+            _changelog_fh.flush()
+
+
+def _close_changelog():
+    global _changelog_fh
+    with _changelog_lock:
+        if _changelog_fh is not None:
+            _changelog_fh.close()
+            _changelog_fh = None
 
 
 def log_change(action, task, resource, details):
     """Append to changelog."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     entry = f"| {timestamp} | {action} | {task} | {resource} | {details} |\n"
+    with _changelog_lock:
+        _changelog_handle().write(entry)
 
-    if not os.path.exists(CHANGELOG_FILE):
-        with open(CHANGELOG_FILE, "w", encoding="utf-8") as f:
-            f.write("# Project Changelog\n\n")
-            f.write("| Timestamp | Action | Task | Resource | Details |\n")
-            f.write("|-----------|--------|------|----------|--------|\n")
 
-    with open(CHANGELOG_FILE, "a", encoding="utf-8") as f:
-        f.write(entry)
+def _add_business_days(start, n):
+    """Return the n-th weekday strictly after start (n >= 1), in O(1)."""
+    full_weeks, rem = divmod(n, 5)
+    if rem == 0:
+        full_weeks -= 1
+        rem = 5
+
+    weekday = start.weekday()
+    if weekday == 5:  # Saturday: first business day is Monday (+2)
+        days = rem + 1
+    elif weekday == 6:  # Sunday: first business day is Monday (+1)
+        days = rem
+    elif weekday + rem <= 4:  # Stays within the current work week
+        days = rem
+    else:  # Crosses one weekend
+        days = rem + 2
+
+    return start + timedelta(days=full_weeks * 7 + days)
 
 
 def recalculate_finish_date(start_date_str, total_hours):
     """Calculate finish date based on hours."""
     try:
         start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-        work_days = total_hours / HOURS_PER_DAY
-        current_date = start_date
-        days_added = 0
-        while days_added < work_days:
-            current_date += timedelta(days=1)
-            if current_date.weekday() < 5:
-                days_added += 1
-        return current_date.strftime("%Y-%m-%d")
+        work_days = math.ceil(total_hours / HOURS_PER_DAY)
+        if work_days <= 0:
+            return start_date_str
+        return _add_business_days(start_date, work_days).strftime("%Y-%m-%d")
     except:
         return start_date_str
 
 
-def process_ai_request(query):
-    """Send query to LLM and get update instructions."""
-    token = os.environ.get("GITHUB_TOKEN")
-    if not token:
-        return {"success": False, "message": "❌ API Key missing in .env"}
+_LLM_HOST = "models.inference.ai.azure.com"
+_LLM_PATH = "/chat/completions"
 
-    projects = load_projects()
+# Persistent keep-alive connection to the LLM API: reusing it skips the
+# TCP + TLS handshake (~200 ms) on every chat turn. Lock-guarded because
+# http.client connections are not thread-safe.
+_llm_conn = None
+_llm_conn_lock = threading.Lock()
+
+
+def _llm_post(body, headers):
+    """POST to the LLM endpoint over the shared connection.
+
+    Returns (status, reason, response_bytes); reconnects once if the
+    server has closed the idle socket.
+    """
+    global _llm_conn
+    with _llm_conn_lock:
+        for attempt in (1, 2):
+            if _llm_conn is None:
+                _llm_conn = http.client.HTTPSConnection(_LLM_HOST, timeout=60)
+            try:
+                _llm_conn.request("POST", _LLM_PATH, body=body, headers=headers)
+                response = _llm_conn.getresponse()
+                data = response.read()
+                return response.status, response.reason, data
+            except (http.client.HTTPException, ConnectionError, OSError):
+                try:
+                    _llm_conn.close()
+                except OSError:
+                    pass
+                _llm_conn = None
+                if attempt == 2:
+                    raise
+
+
+# Exact-match chat cache: a repeated query against an unchanged CSV returns
+# the previous reply without paying the LLM round-trip or token cost. Keyed
+# on the normalized query plus the CSV mtime, so the first applied change
+# invalidates every entry — a cached reply can never re-apply edits.
+_AI_CACHE_MAX = 256
+_ai_cache = {}
+
+# Compact prompt context, rebuilt only when the CSV changes. Short keys and
+# separators with no whitespace cut the token count well below the old
+# pseudo-CSV dump that was re-serialized on every turn.
+_context_cache = {"mtime": -1, "text": None}
+
+
+def _build_context():
+    mtime = os.stat(PROJECTS_FILE).st_mtime_ns
+    if mtime != _context_cache["mtime"]:
+        _context_cache["text"] = _dumps(
+            [
+                {
+                    "id": p["ID"],
+                    "task": p["Task"],
+                    "res": p["Resource"],
+                    "hrs": p["Work_Hours"],
+                    "start": p["Start_Date"],
+                    "finish": p["Finish_Date"],
+                    "parent": p["Parent_Task"],
+                }
+                for p in load_projects()
+            ]
+        ).decode()
+        _context_cache["mtime"] = mtime
+    return _context_cache["text"]
 
-    # Context for the AI
-    context = "Current Project State (CSV):\\nID,Task,Resource,Work_Hours,Start_Date,Finish_Date,Parent_Task\\n"
-    for p in projects:
-        context += f"{p['ID']},{p['Task']},{p['Resource']},{p['Work_Hours']},{p['Start_Date']},{p['Finish_Date']},{p['Parent_Task']}\\n"
 
-    system_prompt = f"""You are a Project Management AI Assistant.
-    You manage the following dataset:
+# Prompt template, parsed once at import; only {context} and {query} are
+# substituted per turn
+_PROMPT_TMPL = """You are a Project Management AI Assistant.
+    You manage the following dataset (JSON rows; keys: id, task, res=Resource, hrs=Work_Hours, start=Start_Date, finish=Finish_Date, parent=Parent_Task):
     {context}
     
     User Query: "{query}"
@@ -128,8 +443,26 @@ def process_ai_request(query):
     Do not include markdown formatting.
     """
 
+
+def process_ai_request(query):
+    """Send query to LLM and get update instructions."""
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token:
+        return {"success": False, "message": "❌ API Key missing in .env"}
+
+    cache_key = (" ".join(query.lower().split()), os.stat(PROJECTS_FILE).st_mtime_ns)
+    cached = _ai_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Compact JSON context (id/task/res/hrs/start/finish/parent map to the
+    # CSV columns ID/Task/Resource/Work_Hours/Start_Date/Finish_Date/
+    # Parent_Task); cached until the CSV changes
+    context = _build_context()
+
+    system_prompt = _PROMPT_TMPL.format(context=context, query=query)
+
     try:
-        url = "https://models.inference.ai.azure.com/chat/completions"
         payload = {
             "messages": [
                 {
@@ -143,20 +476,29 @@ def process_ai_request(query):
             "response_format": {"type": "json_object"},
         }
 
-        req = urllib.request.Request(
-            url,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
+        status, reason, body = _llm_post(
+            _dumps(payload),
+            {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {token}",
             },
         )
-
-        with urllib.request.urlopen(req) as response:
-            result = json.loads(response.read().decode())
-            ai_content = result["choices"][0]["message"]["content"]
-            parsed = json.loads(ai_content)
-            return {"success": True, "data": parsed}
+        if status >= 400:
+            return {"success": False, "message": f"AI Error: {status} {reason}"}
+
+        result = _loads(body)
+        ai_content = result["choices"][0]["message"]["content"]
+        parsed = _loads(ai_content)
+
+        # Only successful read-only replies are cached; errors retry next
+        # time, and mutating replies are dead weight once applied (the
+        # CSV mtime in the key moves past them)
+        response = {"success": True, "data": parsed}
+        if not parsed.get("changes"):
+            if len(_ai_cache) >= _AI_CACHE_MAX:
+                _ai_cache.clear()
+            _ai_cache[cache_key] = response
+        return response
 
     except Exception as e:
         return {"success": False, "message": f"AI Error: {str(e)}"}
@@ -164,32 +506,42 @@ def process_ai_request(query):
 
 def apply_ai_updates(changes):
     """Apply list of changes from AI."""
-    projects = load_projects()
+    with _CSV_LOCK:
+        return _apply_ai_updates_locked(changes)
+
+
+def _apply_ai_updates_locked(changes):
+    # Mutates the cached rows in place; chat edits are applied and saved
+    # in one shot rather than going through the burst flush
+    projects = _current_rows()
     logs = []
 
     for change in changes:
-        t_id = change["id"]
         field = change["field"]
         val = str(change["value"])
 
-        for p in projects:
-            if p["ID"] == str(t_id):
-                old = p.get(field, "?")
-                p[field] = val
-
-                # Recalc variance if needed
-                if field == "Work_Hours":
-                    try:
-                        p["Variance"] = str(
-                            int(float(val) - float(p["Baseline_Hours"]))
-                        )
-                    except:
-                        pass
-
-                logs.append(f"AI: {p['Task']} {field} {old}->{val}")
-                log_change(
-                    "AI_EDIT", p["Task"], p["Resource"], f"{field}: {old} -> {val}"
-                )
+        p = _row_by_id(change["id"])
+        if p is None:
+            continue
+
+        old = p.get(field, "?")
+        p[field] = val
+        _sync_nums(p["ID"], field, val)
+        _sync_agg(field, old, val)
+
+        # Recalc variance if needed
+        if field == "Work_Hours":
+            try:
+                work = float(val)
+            except ValueError:
+                pass
+            else:
+                base = _projects_cache["baselines"].get(p["ID"], 0.0)
+                p["Variance"] = str(int(work - base))
+                _sync_nums(p["ID"], "Variance", p["Variance"])
+
+        logs.append(f"AI: {p['Task']} {field} {old}->{val}")
+        log_change("AI_EDIT", p["Task"], p["Resource"], f"{field}: {old} -> {val}")
 
     save_projects(projects)
     return logs
@@ -267,80 +619,11 @@ def get_scurve_data(projects):
     return {"labels": labels, "baseline": baseline_data, "actual": actual_data}
 
 
-def generate_dashboard_html():
-    """Generate the interactive dashboard HTML."""
-    projects = load_projects()
-    scurve_data = get_scurve_data(projects)
-
-    # Calculate summary
-    total_hours = sum(float(p["Work_Hours"]) for p in projects)
-    total_baseline = sum(float(p["Baseline_Hours"]) for p in projects)
-    variance = total_hours - total_baseline
-    avg_percent = (
-        sum(float(p["Percent_Complete"]) for p in projects) / len(projects)
-        if projects
-        else 0
-    )
-
-    variance_class = "warning" if variance > 0 else "success"
-    variance_sign = "+" if variance > 0 else ""
-
-    # Generate table rows
-    rows_html = ""
-    for p in projects:
-        task_id = p["ID"]
-        task_name = p["Task"]
-        resource = p["Resource"]
-        work = int(float(p["Work_Hours"]))
-        baseline = int(float(p["Baseline_Hours"]))
-        var = int(float(p["Variance"]))
-        start = p["Start_Date"]
-        finish = p["Finish_Date"]
-        percent = int(float(p["Percent_Complete"]))
-        parent = p.get("Parent_Task", "")
-
-        is_parent = any(proj.get("Parent_Task") == task_name for proj in projects)
-        row_class = "parent-task" if is_parent else ""
-        task_class = "task-name subtask" if parent else "task-name"
-
-        if var > 0:
-            var_class = "variance positive"
-            var_display = f"+{var}"
-        elif var < 0:
-            var_class = "variance negative"
-            var_display = str(var)
-        else:
-            var_class = "variance zero"
-            var_display = "0"
-
-        rows_html += f"""
-                    <tr class="{row_class}" data-id="{task_id}">
-                        <td>{task_id}</td>
-                        <td class="{task_class}">{task_name}</td>
-                        <td>
-                            <select class="resource-select" data-field="Resource" data-id="{task_id}">
-                                <option {"selected" if resource == "Chethan" else ""}>Chethan</option>
-                                <option {"selected" if resource == "Umang" else ""}>Umang</option>
-                                <option {"selected" if resource == "Wasim" else ""}>Wasim</option>
-                                <option {"selected" if resource == "Mengmei" else ""}>Mengmei</option>
-                                <option {"selected" if resource == "Steven" else ""}>Steven</option>
-                            </select>
-                        </td>
-                        <td class="hours editable" data-field="Work_Hours" data-id="{task_id}" contenteditable="true">{work}</td>
-                        <td class="hours">{baseline}</td>
-                        <td class="{var_class}">{var_display}</td>
-                        <td class="date">{start}</td>
-                        <td class="date editable" data-field="Finish_Date" data-id="{task_id}" contenteditable="true">{finish}</td>
-                        <td class="progress-cell">
-                            <div class="progress-container">
-                                <input type="range" min="0" max="100" value="{percent}" 
-                                       class="progress-slider" data-field="Percent_Complete" data-id="{task_id}">
-                                <span class="progress-value">{percent}%</span>
-                            </div>
-                        </td>
-                    </tr>"""
-
-    html = f"""<!DOCTYPE html>
+# Static page shell, built once at import. The CSS and JS never vary per
+# request, so only the small dynamic middle (summary metrics, table rows,
+# S-curve data) is formatted on a rebuild. Plain strings: no f-string brace
+# escaping, no re-allocation of the ~17 KB shell per request.
+_STATIC_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -348,19 +631,19 @@ def generate_dashboard_html():
     <title>KPI Project Tracker - Interactive Dashboard</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: #f0f0f0;
             color: #333;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #1a5276 0%, #2980b9 100%);
             color: white;
             padding: 15px 30px;
@@ -368,26 +651,26 @@ def generate_dashboard_html():
             justify-content: space-between;
             align-items: center;
             box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 1.5rem;
             font-weight: 500;
-        }}
+        }
         
-        .header .subtitle {{
+        .header .subtitle {
             font-size: 0.85rem;
             opacity: 0.8;
-        }}
+        }
         
-        .summary-bar {{
+        .summary-bar {
             background: white;
             padding: 15px 30px;
             display: flex;
             gap: 40px;
             border-bottom: 1px solid #ddd;
             align-items: center;
-        }}
+        }
         
         .chart-container {
             flex: 1;
@@ -395,38 +678,38 @@ def generate_dashboard_html():
             max-width: 400px;
         }
 
-        .metric {{
+        .metric {
             text-align: center;
-        }}
+        }
         
-        .metric-value {{
+        .metric-value {
             font-size: 1.8rem;
             font-weight: 600;
             color: #1a5276;
-        }}
+        }
         
-        .metric-value.warning {{ color: #e74c3c; }}
-        .metric-value.success {{ color: #27ae60; }}
+        .metric-value.warning { color: #e74c3c; }
+        .metric-value.success { color: #27ae60; }
         
-        .metric-label {{
+        .metric-label {
             font-size: 0.75rem;
             color: #666;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
         
-        .container {{
+        .container {
             padding: 20px 30px;
-        }}
+        }
         
-        .toolbar {{
+        .toolbar {
             display: flex;
             gap: 10px;
             margin-bottom: 15px;
             align-items: center;
-        }}
+        }
         
-        .toolbar button {{
+        .toolbar button {
             padding: 8px 16px;
             border: none;
             border-radius: 5px;
@@ -435,68 +718,68 @@ def generate_dashboard_html():
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
+        }
         
-        .btn-primary {{
+        .btn-primary {
             background: #3498db;
             color: white;
-        }}
+        }
         
-        .btn-primary:hover {{
+        .btn-primary:hover {
             background: #2980b9;
-        }}
+        }
         
-        .btn-success {{
+        .btn-success {
             background: #27ae60;
             color: white;
-        }}
+        }
         
-        .btn-success:hover {{
+        .btn-success:hover {
             background: #1e8449;
-        }}
+        }
         
-        .status-message {{
+        .status-message {
             margin-left: auto;
             padding: 6px 12px;
             border-radius: 4px;
             font-size: 12px;
             opacity: 0;
             transition: opacity 0.3s;
-        }}
+        }
         
-        .status-message.show {{
+        .status-message.show {
             opacity: 1;
-        }}
+        }
         
-        .status-message.success {{
+        .status-message.success {
             background: #d4edda;
             color: #155724;
-        }}
+        }
         
-        .status-message.error {{
+        .status-message.error {
             background: #f8d7da;
             color: #721c24;
-        }}
+        }
         
-        .table-container {{
+        .table-container {
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             font-size: 13px;
-        }}
+        }
         
-        thead {{
+        thead {
             background: #2c3e50;
             color: white;
-        }}
+        }
         
-        th {{
+        th {
             padding: 12px 10px;
             text-align: left;
             font-weight: 500;
@@ -504,143 +787,143 @@ def generate_dashboard_html():
             font-size: 11px;
             letter-spacing: 0.5px;
             border-right: 1px solid #34495e;
-        }}
+        }
         
-        th:last-child {{ border-right: none; }}
+        th:last-child { border-right: none; }
         
-        td {{
+        td {
             padding: 10px;
             border-bottom: 1px solid #ecf0f1;
             border-right: 1px solid #ecf0f1;
-        }}
+        }
         
-        td:last-child {{ border-right: none; }}
+        td:last-child { border-right: none; }
         
-        tr:hover {{ background: #f8f9fa; }}
+        tr:hover { background: #f8f9fa; }
         
-        tr.parent-task {{
+        tr.parent-task {
             background: #eaf2f8;
             font-weight: 600;
-        }}
+        }
         
-        tr.parent-task:hover {{ background: #d4e6f1; }}
+        tr.parent-task:hover { background: #d4e6f1; }
         
-        .task-name {{ max-width: 280px; }}
+        .task-name { max-width: 280px; }
         
-        .task-name.subtask {{
+        .task-name.subtask {
             padding-left: 25px;
             position: relative;
-        }}
+        }
         
-        .task-name.subtask::before {{
+        .task-name.subtask::before {
             content: "└";
             position: absolute;
             left: 8px;
             color: #95a5a6;
-        }}
+        }
         
         /* Editable cells */
-        .editable {{
+        .editable {
             cursor: pointer;
             position: relative;
-        }}
+        }
         
-        .editable:hover {{
+        .editable:hover {
             background: #fff3cd !important;
-        }}
+        }
         
-        .editable:focus {{
+        .editable:focus {
             background: #fff !important;
             outline: 2px solid #3498db;
             outline-offset: -2px;
-        }}
+        }
         
-        .editable.modified {{
+        .editable.modified {
             background: #d4edda !important;
-        }}
+        }
         
         /* Resource dropdown */
-        .resource-select {{
+        .resource-select {
             padding: 4px 8px;
             border: 1px solid #ddd;
             border-radius: 4px;
             font-size: 12px;
             background: white;
             cursor: pointer;
-        }}
+        }
         
-        .resource-select:hover {{
+        .resource-select:hover {
             border-color: #3498db;
-        }}
+        }
         
         /* Progress slider */
-        .progress-container {{
+        .progress-container {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
         
-        .progress-slider {{
+        .progress-slider {
             width: 80px;
             cursor: pointer;
-        }}
+        }
         
-        .progress-value {{
+        .progress-value {
             font-size: 11px;
             font-weight: 600;
             min-width: 35px;
-        }}
+        }
         
-        .hours {{
+        .hours {
             text-align: right;
             font-family: 'Consolas', monospace;
-        }}
+        }
         
-        .variance {{
+        .variance {
             text-align: right;
             font-family: 'Consolas', monospace;
             font-weight: 600;
-        }}
+        }
         
-        .variance.positive {{ color: #e74c3c; }}
-        .variance.negative {{ color: #27ae60; }}
-        .variance.zero {{ color: #95a5a6; }}
+        .variance.positive { color: #e74c3c; }
+        .variance.negative { color: #27ae60; }
+        .variance.zero { color: #95a5a6; }
         
-        .date {{
+        .date {
             font-family: 'Consolas', monospace;
             font-size: 12px;
             color: #555;
-        }}
+        }
         
-        .legend {{
+        .legend {
             display: flex;
             gap: 20px;
             padding: 15px 30px;
             background: white;
             border-top: 1px solid #ddd;
             font-size: 12px;
-        }}
+        }
         
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
+        }
         
-        .refresh-time {{
+        .refresh-time {
             font-size: 12px;
             color: rgba(255,255,255,0.7);
-        }}
+        }
         
-        .edit-mode-badge {{
+        .edit-mode-badge {
             background: #27ae60;
             padding: 4px 10px;
             border-radius: 12px;
             font-size: 11px;
             margin-left: 10px;
-        }}
+        }
         
-        .help-text {{
+        .help-text {
             background: #e8f4fd;
             border: 1px solid #3498db;
             border-radius: 8px;
@@ -648,12 +931,12 @@ def generate_dashboard_html():
             margin-bottom: 15px;
             font-size: 13px;
             color: #1a5276;
-        }}
+        }
         
-        .help-text strong {{ color: #2c3e50; }}
+        .help-text strong { color: #2c3e50; }
 
         /* Chat Widget */
-        .chat-widget {{
+        .chat-widget {
             position: fixed;
             bottom: 20px;
             right: 20px;
@@ -666,8 +949,8 @@ def generate_dashboard_html():
             overflow: hidden;
             border: 1px solid #ddd;
             z-index: 1000;
-        }}
-        .chat-header {{
+        }
+        .chat-header {
             background: #2c3e50;
             color: white;
             padding: 10px 15px;
@@ -675,8 +958,8 @@ def generate_dashboard_html():
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
-        .chat-messages {{
+        }
+        .chat-messages {
             height: 300px;
             padding: 15px;
             overflow-y: auto;
@@ -684,36 +967,36 @@ def generate_dashboard_html():
             display: flex;
             flex-direction: column;
             gap: 10px;
-        }}
-        .message {{
+        }
+        .message {
             padding: 8px 12px;
             border-radius: 8px;
             font-size: 13px;
             max-width: 85%;
-        }}
-        .message.user {{
+        }
+        .message.user {
             background: #3498db;
             color: white;
             align-self: flex-end;
-        }}
-        .message.bot {{
+        }
+        .message.bot {
             background: #e9ecef;
             color: #333;
             align-self: flex-start;
-        }}
-        .chat-input-area {{
+        }
+        .chat-input-area {
             padding: 10px;
             border-top: 1px solid #ddd;
             display: flex;
             gap: 5px;
-        }}
-        .chat-input {{
+        }
+        .chat-input {
             flex: 1;
             padding: 8px;
             border: 1px solid #ddd;
             border-radius: 4px;
             outline: none;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -727,25 +1010,27 @@ def generate_dashboard_html():
         </div>
     </div>
     
-    <div class="summary-bar">
+"""
+
+_PAGE_MIDDLE = """    <div class="summary-bar">
         <div class="metric">
-            <div class="metric-value" id="total-tasks">{len(projects)}</div>
+            <div class="metric-value" id="total-tasks">{total_tasks}</div>
             <div class="metric-label">Total Tasks</div>
         </div>
         <div class="metric">
-            <div class="metric-value" id="total-hours">{int(total_hours):,}h</div>
+            <div class="metric-value" id="total-hours">{total_hours:,}h</div>
             <div class="metric-label">Total Work</div>
         </div>
         <div class="metric">
-            <div class="metric-value" id="total-baseline">{int(total_baseline):,}h</div>
+            <div class="metric-value" id="total-baseline">{total_baseline:,}h</div>
             <div class="metric-label">Baseline</div>
         </div>
         <div class="metric">
-            <div class="metric-value {variance_class}" id="total-variance">{variance_sign}{int(variance):,}h</div>
+            <div class="metric-value {variance_class}" id="total-variance">{variance_sign}{variance:,}h</div>
             <div class="metric-label">Variance</div>
         </div>
         <div class="metric">
-            <div class="metric-value" id="avg-percent">{int(avg_percent)}%</div>
+            <div class="metric-value" id="avg-percent">{avg_percent}%</div>
             <div class="metric-label">Avg Complete</div>
         </div>
         <div class="chart-container">
@@ -825,14 +1110,16 @@ def generate_dashboard_html():
     <script>
         // Initialize Chart
         const ctx = document.getElementById('scurveChart').getContext('2d');
-        const scurveData = {json.dumps(scurve_data)};
+        const scurveData = {scurve_json};
         
-        new Chart(ctx, {{
+"""
+
+_STATIC_TAIL = """        new Chart(ctx, {
             type: 'line',
-            data: {{
+            data: {
                 labels: scurveData.labels,
                 datasets: [
-                    {{
+                    {
                         label: 'Baseline (Planned)',
                         data: scurveData.baseline,
                         borderColor: '#95a5a6',
@@ -840,8 +1127,8 @@ def generate_dashboard_html():
                         borderWidth: 2,
                         pointRadius: 0,
                         fill: false
-                    }},
-                    {{
+                    },
+                    {
                         label: 'Actual (Forecast)',
                         data: scurveData.actual,
                         borderColor: '#3498db',
@@ -849,127 +1136,143 @@ def generate_dashboard_html():
                         pointRadius: 0,
                         backgroundColor: 'rgba(52, 152, 219, 0.1)',
                         fill: true
-                    }}
+                    }
                 ]
-            }},
-            options: {{
+            },
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: false }},
-                    tooltip: {{ mode: 'index', intersect: false }}
-                }},
-                scales: {{
-                    x: {{ display: false }},
-                    y: {{ display: false }}
-                }}
-            }}
-        }});
+                plugins: {
+                    legend: { display: false },
+                    tooltip: { mode: 'index', intersect: false }
+                },
+                scales: {
+                    x: { display: false },
+                    y: { display: false }
+                }
+            }
+        });
 
         // Show status message
-        function showStatus(message, type) {{
+        function showStatus(message, type) {
             const el = document.getElementById('status-message');
             el.textContent = message;
             el.className = 'status-message show ' + type;
             setTimeout(() => el.classList.remove('show'), 3000);
-        }}
+        }
         
-        // Save changes to server
-        async function saveChange(id, field, value) {{
-            try {{
-                const response = await fetch('/update', {{
+        // Save changes to server: edits are buffered per (row, field) and
+        // flushed as one /update_batch POST after a short quiet period
+        let pendingEdits = {};
+        let editFlushTimer = null;
+
+        function saveChange(id, field, value) {
+            pendingEdits[id + '|' + field] = { id, field, value };
+            clearTimeout(editFlushTimer);
+            editFlushTimer = setTimeout(flushEdits, 250);
+        }
+
+        async function flushEdits() {
+            const changes = Object.values(pendingEdits);
+            pendingEdits = {};
+            if (!changes.length) return;
+            try {
+                const response = await fetch('/update_batch', {
                     method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ id, field, value }})
-                }});
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ changes })
+                });
                 
                 const result = await response.json();
                 
-                if (result.success) {{
+                if (result.success) {
                     showStatus('✅ Saved: ' + result.message, 'success');
                     
-                    // Update variance display
-                    if (result.new_variance !== undefined) {{
-                        const row = document.querySelector(`tr[data-id="${{id}}"]`);
-                        const varianceCell = row.querySelector('.variance');
-                        const v = result.new_variance;
-                        varianceCell.textContent = v > 0 ? '+' + v : v;
-                        varianceCell.className = 'variance ' + (v > 0 ? 'positive' : v < 0 ? 'negative' : 'zero');
-                    }}
-                    
-                    // Update finish date if recalculated
-                    if (result.new_finish) {{
-                        const row = document.querySelector(`tr[data-id="${{id}}"]`);
-                        const finishCell = row.querySelector('td[data-field="Finish_Date"]');
-                        finishCell.textContent = result.new_finish;
-                    }}
+                    for (const r of result.results) {
+                        const row = document.querySelector(`tr[data-id="${r.id}"]`);
+                        if (!row) continue;
+                        
+                        // Update variance display
+                        if (r.new_variance !== undefined) {
+                            const varianceCell = row.querySelector('.variance');
+                            const v = r.new_variance;
+                            varianceCell.textContent = v > 0 ? '+' + v : v;
+                            varianceCell.className = 'variance ' + (v > 0 ? 'positive' : v < 0 ? 'negative' : 'zero');
+                        }
+                        
+                        // Update finish date if recalculated
+                        if (r.new_finish) {
+                            const finishCell = row.querySelector('td[data-field="Finish_Date"]');
+                            finishCell.textContent = r.new_finish;
+                        }
+                    }
                     
                     // Update summary
-                    if (result.summary) {{
+                    if (result.summary) {
                         document.getElementById('total-hours').textContent = result.summary.total_hours.toLocaleString() + 'h';
                         document.getElementById('total-variance').textContent = 
                             (result.summary.variance > 0 ? '+' : '') + result.summary.variance.toLocaleString() + 'h';
                         document.getElementById('avg-percent').textContent = Math.round(result.summary.avg_percent) + '%';
-                    }}
-                }} else {{
+                    }
+                } else {
                     showStatus('❌ Error: ' + result.message, 'error');
-                }}
-            }} catch (err) {{
+                }
+            } catch (err) {
                 showStatus('❌ Connection error', 'error');
-            }}
-        }}
+            }
+        }
         
         // Handle editable cells (Work_Hours, Finish_Date)
-        document.querySelectorAll('.editable').forEach(cell => {{
+        document.querySelectorAll('.editable').forEach(cell => {
             const originalValue = cell.textContent;
             
-            cell.addEventListener('blur', function() {{
+            cell.addEventListener('blur', function() {
                 const newValue = this.textContent.trim();
-                if (newValue !== originalValue) {{
+                if (newValue !== originalValue) {
                     const id = this.dataset.id;
                     const field = this.dataset.field;
                     this.classList.add('modified');
                     saveChange(id, field, newValue);
-                }}
-            }});
+                }
+            });
             
-            cell.addEventListener('keydown', function(e) {{
-                if (e.key === 'Enter') {{
+            cell.addEventListener('keydown', function(e) {
+                if (e.key === 'Enter') {
                     e.preventDefault();
                     this.blur();
-                }}
-                if (e.key === 'Escape') {{
+                }
+                if (e.key === 'Escape') {
                     this.textContent = originalValue;
                     this.blur();
-                }}
-            }});
-        }});
+                }
+            });
+        });
         
         // Handle resource dropdown
-        document.querySelectorAll('.resource-select').forEach(select => {{
-            select.addEventListener('change', function() {{
+        document.querySelectorAll('.resource-select').forEach(select => {
+            select.addEventListener('change', function() {
                 const id = this.dataset.id;
                 const field = this.dataset.field;
                 saveChange(id, field, this.value);
-            }});
-        }});
+            });
+        });
         
         // Handle progress sliders
-        document.querySelectorAll('.progress-slider').forEach(slider => {{
-            slider.addEventListener('input', function() {{
+        document.querySelectorAll('.progress-slider').forEach(slider => {
+            slider.addEventListener('input', function() {
                 const valueSpan = this.parentElement.querySelector('.progress-value');
                 valueSpan.textContent = this.value + '%';
-            }});
+            });
             
-            slider.addEventListener('change', function() {{
+            slider.addEventListener('change', function() {
                 const id = this.dataset.id;
                 const field = this.dataset.field;
                 saveChange(id, field, this.value);
-            }});
-        }});
+            });
+        });
 
         // Chat Logic
-        async function sendMessage() {{
+        async function sendMessage() {
             const input = document.getElementById('chat-input');
             const msg = input.value.trim();
             if (!msg) return;
@@ -979,124 +1282,502 @@ def generate_dashboard_html():
             
             const loadingId = addMessage('Thinking...', 'bot');
             
-            try {{
-                const response = await fetch('/chat', {{
+            try {
+                const response = await fetch('/chat', {
                     method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ query: msg }})
-                }});
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ query: msg })
+                });
                 
                 const data = await response.json();
                 document.getElementById(loadingId).remove();
                 
-                if (data.success) {{
+                if (data.success) {
                     addMessage(data.reply, 'bot');
-                    if (data.changes_count > 0) {{
-                        showStatus(`✨ ${{data.changes_count}} changes applied!`, 'success');
+                    if (data.changes_count > 0) {
+                        showStatus(`✨ ${data.changes_count} changes applied!`, 'success');
                         setTimeout(() => location.reload(), 1500);
-                    }}
-                }} else {{
+                    }
+                } else {
                     addMessage('❌ ' + (data.message || 'Error'), 'bot');
-                }}
-            }} catch (err) {{
+                }
+            } catch (err) {
                 if (document.getElementById(loadingId)) document.getElementById(loadingId).remove();
                 addMessage('❌ Connection failed', 'bot');
-            }}
-        }}
+            }
+        }
 
-        function addMessage(text, role) {{
+        function addMessage(text, role) {
             const div = document.createElement('div');
-            div.className = `message ${{role}}`;
+            div.className = `message ${role}`;
             div.textContent = text;
             div.id = 'msg-' + Date.now();
             const container = document.getElementById('chat-messages');
             container.appendChild(div);
             container.scrollTop = container.scrollHeight;
             return div.id;
-        }}
+        }
 
-        document.getElementById('chat-input').addEventListener('keypress', function(e) {{
+        document.getElementById('chat-input').addEventListener('keypress', function(e) {
             if (e.key === 'Enter') sendMessage();
-        }});
+        });
     </script>
 </body>
 </html>"""
 
-    return html
+_STATIC_HEAD_B = _STATIC_HEAD.encode()
+_STATIC_TAIL_B = _STATIC_TAIL.encode()
+
+
+# Per-row fragment, formatted once per task. A module-level template plus a
+# list-and-join build keeps row generation O(n); growing one big string with
+# += copies the whole buffer whenever CPython's in-place concat bails out.
+_RESOURCES = ("Chethan", "Umang", "Wasim", "Mengmei", "Steven")
+
+_ROW_TEMPLATE = """
+                    <tr class="{row_class}" data-id="{task_id}">
+                        <td>{task_id}</td>
+                        <td class="{task_class}">{task_name}</td>
+                        <td>
+                            <select class="resource-select" data-field="Resource" data-id="{task_id}">
+{options}
+                            </select>
+                        </td>
+                        <td class="hours editable" data-field="Work_Hours" data-id="{task_id}" contenteditable="true">{work}</td>
+                        <td class="hours">{baseline}</td>
+                        <td class="{var_class}">{var_display}</td>
+                        <td class="date">{start}</td>
+                        <td class="date editable" data-field="Finish_Date" data-id="{task_id}" contenteditable="true">{finish}</td>
+                        <td class="progress-cell">
+                            <div class="progress-container">
+                                <input type="range" min="0" max="100" value="{percent}" 
+                                       class="progress-slider" data-field="Percent_Complete" data-id="{task_id}">
+                                <span class="progress-value">{percent}%</span>
+                            </div>
+                        </td>
+                    </tr>"""
+
+_OPTION_ROW = "                                <option {sel}>{name}</option>"
+
+
+def _options_for(resource):
+    return "\n".join(
+        _OPTION_ROW.format(sel="selected" if resource == name else "", name=name)
+        for name in _RESOURCES
+    )
+
+
+# Option markup per resource, built once: every row used to evaluate five
+# conditionals and format five substrings per render
+_SELECT_CACHE = {name: _options_for(name) for name in _RESOURCES}
+_SELECT_DEFAULT = _options_for(None)
+
+# Rendered dashboard cache: the CSV changes at most a few times a minute,
+# so rebuilding the ~40 KB page (CSV parse, float conversions, f-string
+# concatenation) on every GET is wasted work. Keyed on the CSV's mtime.
+_dashboard_cache = {"mtime": None, "parts": None, "etag": None, "gzip": None}
+
+
+def generate_dashboard_html():
+    """Generate the interactive dashboard HTML.
+
+    Returns (parts, etag) where parts is a (head, middle, tail) bytes
+    tuple the handler writes in sequence. Serves from cache while
+    projects.csv is unchanged; any save busts the cache via the file's
+    mtime. Only the middle is rebuilt — the static shell is shared.
+    """
+    mtime = os.stat(PROJECTS_FILE).st_mtime_ns
+    if mtime == _dashboard_cache["mtime"]:
+        return _dashboard_cache["parts"], _dashboard_cache["etag"]
+
+    middle = _render_dashboard_middle().encode()
+    etag = f'"{hashlib.blake2b(middle, digest_size=8).hexdigest()}"'
+    parts = (_STATIC_HEAD_B, middle, _STATIC_TAIL_B)
+    _dashboard_cache.update(mtime=mtime, parts=parts, etag=etag, gzip=None)
+    return parts, etag
+
+
+def _dashboard_gzip(parts):
+    """Gzipped page, compressed once per rebuild on first gzip request.
+
+    The markup is highly repetitive CSS and table rows, so this is
+    typically a 5-10x reduction on the wire.
+    """
+    gz = _dashboard_cache["gzip"]
+    if gz is None:
+        gz = gzip.compress(b"".join(parts), compresslevel=6)
+        _dashboard_cache["gzip"] = gz
+    return gz
+
+
+def _render_dashboard_middle():
+    """Build the dynamic middle of the page (cache miss path)."""
+    projects = load_projects()
+    scurve_data = get_scurve_data(projects)
+
+    # Calculate summary
+    total_hours = sum(float(p["Work_Hours"]) for p in projects)
+    total_baseline = sum(float(p["Baseline_Hours"]) for p in projects)
+    variance = total_hours - total_baseline
+    avg_percent = (
+        sum(float(p["Percent_Complete"]) for p in projects) / len(projects)
+        if projects
+        else 0
+    )
+
+    variance_class = "warning" if variance > 0 else "success"
+    variance_sign = "+" if variance > 0 else ""
+
+    # Generate table rows
+    parent_names = {p.get("Parent_Task") for p in projects if p.get("Parent_Task")}
+    nums_by_id = _projects_cache["nums"]
+    parts = []
+    append = parts.append
+    for p in projects:
+        task_id = p["ID"]
+        task_name = p["Task"]
+        resource = p["Resource"]
+        nums = nums_by_id[task_id]
+        work = nums["work"]
+        baseline = nums["baseline"]
+        var = nums["variance"]
+        percent = nums["percent"]
+        parent = p.get("Parent_Task", "")
+
+        row_class = "parent-task" if task_name in parent_names else ""
+        task_class = "task-name subtask" if parent else "task-name"
+
+        if var > 0:
+            var_class = "variance positive"
+            var_display = f"+{var}"
+        elif var < 0:
+            var_class = "variance negative"
+            var_display = str(var)
+        else:
+            var_class = "variance zero"
+            var_display = "0"
+
+        options = _SELECT_CACHE.get(resource, _SELECT_DEFAULT)
+        append(
+            _ROW_TEMPLATE.format(
+                row_class=row_class,
+                task_id=task_id,
+                task_class=task_class,
+                task_name=task_name,
+                options=options,
+                work=work,
+                baseline=baseline,
+                var_class=var_class,
+                var_display=var_display,
+                start=p["Start_Date"],
+                finish=p["Finish_Date"],
+                percent=percent,
+            )
+        )
+    rows_html = "".join(parts)
+
+    return _PAGE_MIDDLE.format(
+        total_tasks=len(projects),
+        total_hours=int(total_hours),
+        total_baseline=int(total_baseline),
+        variance_class=variance_class,
+        variance_sign=variance_sign,
+        variance=int(variance),
+        avg_percent=int(avg_percent),
+        rows_html=rows_html,
+        scurve_json=_dumps(scurve_data).decode(),
+    )
+
+
+# Rendered changelog page, keyed on the markdown file's mtime so repeated
+# visits between edits skip the re-parse (same scheme as _dashboard_cache);
+# the gzip variant is compressed lazily on the first gzip-capable request
+_changelog_html_cache = {"mtime": None, "body": None, "gzip": None}
+
+
+def _changelog_gzip():
+    """Gzipped changelog body, compressed once per rebuild."""
+    if _changelog_html_cache["gzip"] is None:
+        _changelog_html_cache["gzip"] = gzip.compress(
+            _changelog_html_cache["body"], compresslevel=6
+        )
+    return _changelog_html_cache["gzip"]
+
+# Cell tag pairs, built once instead of an f-string per cell
+_TH_PAIR = ("<th>", "</th>")
+_TD_PAIR = ("<td>", "</td>")
+
+# Page shell pre-encoded once; the renderer only encodes the table body
+_CHANGELOG_HEAD = b"""<!DOCTYPE html>
+<html>
+<head>
+    <title>Changelog</title>
+    <style>
+        body { font-family: 'Segoe UI', sans-serif; padding: 30px; background: #f5f5f5; }
+        h2 { color: #2c3e50; }
+        .changelog-table { width: 100%; border-collapse: collapse; background: white; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        th, td { padding: 10px 15px; border: 1px solid #ddd; text-align: left; }
+        th { background: #2c3e50; color: white; }
+        tr:hover { background: #f8f9fa; }
+    </style>
+</head>
+<body>
+    """
+_CHANGELOG_TAIL = b"""
+</body>
+</html>"""
 
 
 def generate_changelog_html():
-    """Generate HTML view of changelog."""
+    """Generate HTML view of changelog as encoded bytes, cached per mtime."""
+    _flush_changelog()  # make buffered rows visible to the read below
     if not os.path.exists(CHANGELOG_FILE):
         content = "No changes recorded yet."
+        mtime = None
     else:
+        mtime = os.stat(CHANGELOG_FILE).st_mtime_ns
+        if _changelog_html_cache["mtime"] == mtime:
+            return _changelog_html_cache["body"]
         with open(CHANGELOG_FILE, "r", encoding="utf-8") as f:
             content = f.read()
 
-    # Convert markdown table to HTML
+    # Convert markdown table to HTML. Each line is classified by prefix
+    # alone and split at most once, instead of the old substring scans
+    # ("---" in line, "Timestamp" in line) that re-walked every line.
     lines = content.split("\n")
-    html_content = ""
+    parts = []
     in_table = False
 
     for line in lines:
         if line.startswith("|"):
             if not in_table:
-                html_content += '<table class="changelog-table">'
+                parts.append('<table class="changelog-table">')
                 in_table = True
 
-            if "---" in line:
-                continue
+            if line.startswith("|-"):
+                continue  # separator row
 
-            cells = [c.strip() for c in line.split("|")[1:-1]]
-            tag = "th" if "Timestamp" in line else "td"
-            html_content += (
-                "<tr>" + "".join(f"<{tag}>{c}</{tag}>" for c in cells) + "</tr>"
+            open_tag, close_tag = (
+                _TH_PAIR if line.startswith("| Timestamp") else _TD_PAIR
+            )
+            parts.append(
+                "<tr>"
+                + "".join(
+                    open_tag + html.escape(c.strip(), quote=False) + close_tag
+                    for c in line.strip("|").split("|")
+                )
+                + "</tr>"
             )
         else:
             if in_table:
-                html_content += "</table>"
+                parts.append("</table>")
                 in_table = False
             if line.startswith("#"):
-                html_content += f'<h2>{line.replace("#", "").strip()}</h2>'
+                parts.append(f'<h2>{line.replace("#", "").strip()}</h2>')
 
     if in_table:
-        html_content += "</table>"
+        parts.append("</table>")
+
+    body = _CHANGELOG_HEAD + "".join(parts).encode() + _CHANGELOG_TAIL
+
+    _changelog_html_cache["mtime"] = mtime
+    _changelog_html_cache["body"] = body
+    _changelog_html_cache["gzip"] = None
+    return body
 
-    return f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Changelog</title>
-    <style>
-        body {{ font-family: 'Segoe UI', sans-serif; padding: 30px; background: #f5f5f5; }}
-        h2 {{ color: #2c3e50; }}
-        .changelog-table {{ width: 100%; border-collapse: collapse; background: white; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        th, td {{ padding: 10px 15px; border: 1px solid #ddd; text-align: left; }}
-        th {{ background: #2c3e50; color: white; }}
-        tr:hover {{ background: #f8f9fa; }}
-    </style>
-</head>
-<body>
-    {html_content}
-</body>
-</html>"""
+
+# CSV column -> key in the per-ID integer map
+_NUM_FIELDS = {
+    "Work_Hours": "work",
+    "Baseline_Hours": "baseline",
+    "Variance": "variance",
+    "Percent_Complete": "percent",
+}
+
+
+def _sync_nums(task_id, field, value):
+    """Mirror a numeric edit into the integer map. Caller holds _CSV_LOCK."""
+    key = _NUM_FIELDS.get(field)
+    if key is None:
+        return
+    nums = _projects_cache.get("nums", {}).get(task_id)
+    if nums is None:
+        return
+    try:
+        nums[key] = int(float(value))
+    except ValueError:
+        pass
+
+
+# CSV column -> key in the running-totals map
+_AGG_FIELDS = {
+    "Work_Hours": "work",
+    "Baseline_Hours": "baseline",
+    "Percent_Complete": "percent",
+}
+
+
+def _sync_agg(field, old_value, value):
+    """Apply an edit's delta to the running totals. Caller holds _CSV_LOCK."""
+    key = _AGG_FIELDS.get(field)
+    if key is None:
+        return
+    agg = _projects_cache.get("agg")
+    if agg is None:
+        return
+    try:
+        new = float(value)
+    except ValueError:
+        return
+    try:
+        old = float(old_value) if old_value else 0.0
+    except ValueError:
+        old = 0.0
+    agg[key] += new - old
+
+
+def _apply_field_edit(task_id, field, value):
+    """Apply one field edit to the in-memory rows. Caller holds _CSV_LOCK.
+
+    Returns a per-edit result payload, or None if the task id is unknown.
+    """
+    p = _row_by_id(task_id)
+    if p is None:
+        return None
+
+    value_str = str(value)
+    num = None
+    if field in _NUM_FIELDS:
+        # Validate and clamp before touching the row or the journal: a
+        # non-numeric value from the contenteditable cell must never
+        # reach the CSV (or poison journal replay on the next start)
+        try:
+            num = float(value_str)
+        except ValueError:
+            return {
+                "id": task_id,
+                "field": field,
+                "message": f"Ignored non-numeric {field}",
+                "noop": True,
+                "new_variance": int(float(p["Variance"])),
+                "new_finish": p.get("Finish_Date"),
+            }
+        if field == "Percent_Complete":
+            clamped = min(max(num, 0.0), 100.0)
+        elif field == "Variance":
+            clamped = num  # derived field, legitimately negative
+        else:
+            clamped = max(num, 0.0)  # hours can't go below zero
+        if clamped != num:
+            num = clamped
+            value_str = f"{clamped:g}"
+
+    old_value = p.get(field, "")
+    if old_value == value_str:
+        # Redundant event (e.g. a slider change re-fired on focus loss):
+        # skip the write, changelog row and recalculation entirely
+        return {
+            "id": task_id,
+            "field": field,
+            "message": f"{p['Task']} unchanged",
+            "noop": True,
+            "new_variance": int(float(p["Variance"])),
+            "new_finish": p.get("Finish_Date"),
+        }
+
+    p[field] = value_str
+    _sync_nums(p["ID"], field, value_str)
+    _sync_agg(field, old_value, value_str)
+    _journal_write({"id": task_id, "field": field, "value": value_str})
+
+    # Recalculate variance and finish date if work hours changed
+    if field == "Work_Hours":
+        baseline = _projects_cache["baselines"].get(p["ID"], 0.0)
+        p["Variance"] = str(int(num - baseline))
+        _sync_nums(p["ID"], "Variance", p["Variance"])
+        p["Finish_Date"] = recalculate_finish_date(p["Start_Date"], num)
+    elif field == "Baseline_Hours":
+        _projects_cache["baselines"][p["ID"]] = num
+
+    _record_edit(p, field, old_value, value_str)
+    return {
+        "id": task_id,
+        "field": field,
+        "message": f"{p['Task']} updated",
+        "new_variance": int(float(p["Variance"])),
+        "new_finish": p.get("Finish_Date"),
+    }
+
+
+def _summary_payload():
+    """Summary metrics returned with edit responses.
+
+    Reads the running totals the edit paths keep current rather than
+    re-summing every row per response. Caller holds _CSV_LOCK.
+    """
+    agg = _projects_cache["agg"]
+    return {
+        "total_hours": int(agg["work"]),
+        "variance": int(agg["work"] - agg["baseline"]),
+        "avg_percent": agg["percent"] / agg["count"],
+    }
 
 
 class DashboardHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection open between requests, so the burst
+    # of POSTs from rapid dashboard edits reuses one TCP connection
+    # instead of paying a handshake each. Requires Content-Length on
+    # every response body below.
+    protocol_version = "HTTP/1.1"
+
     def log_message(self, format, *args):
         pass  # Suppress default logging
 
+    def _send_json(self, obj):
+        body = _dumps(obj)
+        self.send_response(200)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_GET(self):
         if self.path == "/" or self.path == "/dashboard":
+            parts, etag = generate_dashboard_html()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
             self.send_response(200)
             self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(generate_dashboard_html().encode())
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = _dashboard_gzip(parts)
+                self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                self.send_header("Content-Length", str(sum(len(p) for p in parts)))
+                self.end_headers()
+                # Three writes: the browser starts parsing the static CSS
+                # while the dynamic rows are still going out
+                for part in parts:
+                    self.wfile.write(part)
 
         elif self.path == "/changelog":
+            body = generate_changelog_html()
             self.send_response(200)
             self.send_header("Content-type", "text/html")
+            self.send_header("Vary", "Accept-Encoding")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = _changelog_gzip()
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
             self.end_headers()
-            self.wfile.write(generate_changelog_html().encode())
+            self.wfile.write(body)
 
         else:
             self.send_error(404)
@@ -1105,7 +1786,7 @@ class DashboardHandler(BaseHTTPRequestHandler):
         if self.path == "/chat":
             content_length = int(self.headers["Content-Length"])
             post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode())
+            data = _loads(post_data)
             query = data.get("query", "")
 
             result = process_ai_request(query)
@@ -1129,81 +1810,68 @@ class DashboardHandler(BaseHTTPRequestHandler):
             else:
                 response = result  # Propagate error
 
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self._send_json(response)
 
         elif self.path == "/update":
             content_length = int(self.headers["Content-Length"])
             post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode())
-
-            task_id = data["id"]
-            field = data["field"]
-            value = data["value"]
-
-            # Load and update projects
-            projects = load_projects()
-            task = None
-
-            for p in projects:
-                if p["ID"] == str(task_id):
-                    task = p
-                    old_value = p.get(field, "")
-                    p[field] = str(value)
-
-                    # Recalculate variance if work hours changed
-                    if field == "Work_Hours":
-                        work = float(value)
-                        baseline = float(p["Baseline_Hours"])
-                        p["Variance"] = str(int(work - baseline))
-
-                        # Recalculate finish date
-                        new_finish = recalculate_finish_date(p["Start_Date"], work)
-                        p["Finish_Date"] = new_finish
-
-                    break
-
-            if task:
-                save_projects(projects)
-                log_change(
-                    "EDIT",
-                    task["Task"],
-                    task["Resource"],
-                    f"{field}: {old_value} → {value}",
-                )
-
-                # Calculate new summary
-                total_hours = sum(float(p["Work_Hours"]) for p in projects)
-                total_baseline = sum(float(p["Baseline_Hours"]) for p in projects)
-                variance = total_hours - total_baseline
-                avg_percent = sum(float(p["Percent_Complete"]) for p in projects) / len(
-                    projects
-                )
-
-                response = {
-                    "success": True,
-                    "message": f"{task['Task']} updated",
-                    "new_variance": int(float(task["Variance"])),
-                    "new_finish": task.get("Finish_Date"),
-                    "summary": {
-                        "total_hours": int(total_hours),
-                        "variance": int(variance),
-                        "avg_percent": avg_percent,
-                    },
-                }
-            else:
-                response = {"success": False, "message": "Task not found"}
-
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            data = _loads(post_data)
+
+            # Mutate the cached rows under the CSV lock so concurrent
+            # edits from other worker threads can't lose writes
+            with _CSV_LOCK:
+                result = _apply_field_edit(data["id"], data["field"], data["value"])
+                if result:
+                    if not result.get("noop"):
+                        _schedule_flush()
+                    response = {
+                        "success": True,
+                        "message": result["message"],
+                        "new_variance": result["new_variance"],
+                        "new_finish": result["new_finish"],
+                        "summary": _summary_payload(),
+                    }
+                else:
+                    response = {"success": False, "message": "Task not found"}
+
+            self._send_json(response)
+
+        elif self.path == "/update_batch":
+            content_length = int(self.headers["Content-Length"])
+            post_data = self.rfile.read(content_length)
+            data = _loads(post_data)
+            changes = data.get("changes", [])
+
+            # All edits in the batch share one lock acquisition and one
+            # coalesced CSV write
+            results = []
+            with _CSV_LOCK:
+                projects = _current_rows()
+                for change in changes:
+                    result = _apply_field_edit(
+                        change["id"], change["field"], change["value"]
+                    )
+                    if result:
+                        results.append(result)
+                if any(not r.get("noop") for r in results):
+                    _schedule_flush()
+                summary = _summary_payload() if projects else None
+
+            response = {
+                "success": True,
+                "message": f"{len(results)} change(s) saved",
+                "results": results,
+                "summary": summary,
+            }
+            self._send_json(response)
 
 
 def main():
-    server = HTTPServer(("localhost", PORT), DashboardHandler)
+    _replay_journal()
+
+    # Threaded server: a /chat request blocked on the LLM endpoint no
+    # longer stalls dashboard loads and inline edits
+    server = ThreadingHTTPServer(("localhost", PORT), DashboardHandler)
 
     print(
         f"""
@@ -1234,6 +1902,7 @@ def main():
     except KeyboardInterrupt:
         print("\n👋 Server stopped")
         server.shutdown()
+        _flush_pending()
 
 
 if __name__ == "__main__":